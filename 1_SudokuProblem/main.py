@@ -1,10 +1,63 @@
 import re  # Used for interpreting the input file
 import time  # Used for measuring the execution time
+from array import array  # Used for keeping the streamed latencies compact
+import random  # Used for generating sudokus
+import os  # Used for getting the number of processors
+from functools import partial  # Used for passing the engine to the worker processes
+from functools import lru_cache  # Used for caching the unit lookups of each box size
+from math import isqrt  # Used for calculating the box size of a board
+from itertools import islice  # Used for reading a bounded number of boards from a stream
+from multiprocessing import Pool  # Used for solving sudokus in parallel
+
+
+# Symbols of the board square values (0 represent empty squares), values above 9 are written as letters
+# symbol_values: hashmap from a symbol to its value (dots also represent empty squares)
+SYMBOLS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+SYMBOL_VALUES = dict([(symbol, value) for value, symbol in enumerate(SYMBOLS)] + [(".", 0)])
+
+# Minimum number of clues of generated sudokus for each box size, the uniqueness checks of 25x25 boards with fewer
+# clues take minutes instead of seconds (9x9 and 16x16 boards can be generated down to their minimal clues)
+CLUE_FLOORS = {5: 350}
+
+
+# Function that returns the lookups of the board square indices (row * size + column) for a box size
+# Returns a tuple (units, peers, cell_units, intersections) that is cached since it only depends on the box size
+# units: list of the rows, columns, and boxes as lists of board square indices
+# peers: list of sets with the indices of the board squares that share a unit with the board square
+# cell_units: list of tuples with the indices of the row, column, and box unit of each board square
+# intersections: list of tuples (segment, rest of line, rest of box) for each line and box that intersect
+# box_size: integer that determine the width of a box (3 for 9x9, 4 for 16x16, and 5 for 25x25)
+@lru_cache(maxsize=None)
+def unit_lookups(box_size: int):
+    size = box_size ** 2
+    units = [[i * size + j for j in range(size)] for i in range(size)] + \
+            [[i * size + j for i in range(size)] for j in range(size)] + \
+            [[((b % box_size) * box_size + c // box_size) * size + (b // box_size) * box_size + c % box_size
+              for c in range(size)] for b in range(size)]
+    peers = [set() for _ in range(size * size)]
+    for unit in units:
+        for cell in unit:
+            peers[cell].update(unit)
+    for cell in range(size * size):
+        peers[cell].discard(cell)
+    cell_units = [(i, size + j, 2 * size + (i // box_size) + (j // box_size) * box_size)
+                  for i in range(size) for j in range(size)]
+    intersections = []
+    for line in units[:2 * size]:
+        for box in units[2 * size:]:
+            segment = [cell for cell in line if cell in box]
+            if segment:
+                intersections.append((segment,
+                                      [cell for cell in line if cell not in segment],
+                                      [cell for cell in box if cell not in segment]))
+    return units, peers, cell_units, intersections
 
 
 # Sudoku: Class to keep track of the sudoku board
 # id: string as a unique identifier
 # board: list of list that contains integers to keep track of the board (0 represent empty squares)
+# box_size: integer to keep track of the width of a box (the board has box_size ** 2 rows and columns)
+# size: integer to keep track of the number of rows, columns, boxes, and values
 # lookup_rows: list of list that contains integers to keep track of used row values
 # lookup_columns: list of list that contains integers to keep track of used row values
 # lookup_boxes: list of list that contains integers to keep track of used box values
@@ -13,14 +66,18 @@ class Sudoku:
     def __init__(self, id: str, board):
         self.id = id
         self.board = board
-        self.lookup_rows = [[], [], [], [], [], [], [], [], []]
-        self.lookup_columns = [[], [], [], [], [], [], [], [], []]
-        self.lookup_boxes = [[], [], [], [], [], [], [], [], []]
-        self.lookup_empty = []
+        self.size = len(board)
+        self.box_size = isqrt(self.size)
+        self.update_lookups()
 
-        # Assign values to the lookups based on the values on the board
-        for i in range(9):
-            for j in range(9):
+    # Assign values to the lookups based on the values on the board
+    def update_lookups(self):
+        self.lookup_rows = [[] for _ in range(self.size)]
+        self.lookup_columns = [[] for _ in range(self.size)]
+        self.lookup_boxes = [[] for _ in range(self.size)]
+        self.lookup_empty = []
+        for i in range(self.size):
+            for j in range(self.size):
                 value = self.board[i][j]
 
                 # If the board square is empty (i.e. has a value of 0) add its position to the lookup
@@ -32,40 +89,41 @@ class Sudoku:
                 else:
                     self.lookup_rows[i].append(value)
                     self.lookup_columns[j].append(value)
-                    self.lookup_boxes[(i // 3) + (j // 3) * 3].append(value)
+                    self.lookup_boxes[(i // self.box_size) + (j // self.box_size) * self.box_size].append(value)
 
-    def __repr__(self):
-        matrix_horizontal_line = "|-------|-------|-------|"
-        result = f"ID: {self.id}\n{matrix_horizontal_line}\n"
+    # Return a new instance of the Sudoku class with a copy of the board
+    def copy(self):
+        return Sudoku(self.id, [row[:] for row in self.board])
+
+    # Return the board as a matrix with a line between the boxes (values above 9 are written as letters)
+    def matrix(self):
+        matrix_horizontal_line = "|" + ("-" * (self.box_size * 2 + 1) + "|") * self.box_size
+        result = f"{matrix_horizontal_line}\n"
         # Append to result string row-wise from matrix values
-        for i in range(9):
-            result += f"| {self.board[i][0]} {self.board[i][1]} {self.board[i][2]} " \
-                      f"| {self.board[i][3]} {self.board[i][4]} {self.board[i][5]} " \
-                      f"| {self.board[i][6]} {self.board[i][7]} {self.board[i][8]} |\n"
-            if i in [2, 5, 8]:
+        for i in range(self.size):
+            for j in range(0, self.size, self.box_size):
+                result += "| " + " ".join(SYMBOLS[value] for value in self.board[i][j:j + self.box_size]) + " "
+            result += "|\n"
+            if i % self.box_size == self.box_size - 1:
                 result += f"{matrix_horizontal_line}\n"
-        # Return the string representation of the sudoku board
         return result
 
+    def __repr__(self):
+        # Return the string representation of the sudoku board
+        return f"ID: {self.id}\n{self.matrix()}"
+
     def __str__(self):
-        matrix_horizontal_line = "|-------|-------|-------|"
-        result = f"ID {self.id}\n{matrix_horizontal_line}\n"
-        # Append to result string row-wise from matrix values
-        for i in range(9):
-            result += f"| {self.board[i][0]} {self.board[i][1]} {self.board[i][2]} " \
-                      f"| {self.board[i][3]} {self.board[i][4]} {self.board[i][5]} " \
-                      f"| {self.board[i][6]} {self.board[i][7]} {self.board[i][8]} |\n"
-            if i in [2, 5, 8]:
-                result += f"{matrix_horizontal_line}\n"
         # Return the string representation of the sudoku board
-        return result
+        return f"ID {self.id}\n{self.matrix()}"
 
 
-# Function that interpret the problem specification from "input.txt"
+# Function that interpret the problem specification from "input.txt" (or another file with the same format)
+# The board size is given by the length of the first row (values above 9 are written as letters)
 # 1. parameters: dictionary to keep track of parameters (none of them is relevant in our case)
 # 2. sudokus: list to keep track of instances of the Sudoku class
-def specification(parameters: dict, sudokus: list):
-    file = open('input.txt', 'r')
+# 3. filename: string with the path to the file
+def specification(parameters: dict, sudokus: list, filename: str = "input.txt"):
+    file = open(filename, 'r')
     end_of_file = False
     while not end_of_file:
         # Get next line from file
@@ -83,27 +141,79 @@ def specification(parameters: dict, sudokus: list):
         # if line consists of the word "SUDOKU" followed by a whitespace an integer it represents a sudoku game
         elif re.search(r"SUDOKU \d+$", line):
             id = line.rstrip("\n")
-            board = [[0, 0, 0, 0, 0, 0, 0, 0, 0],
-                     [0, 0, 0, 0, 0, 0, 0, 0, 0],
-                     [0, 0, 0, 0, 0, 0, 0, 0, 0],
-                     [0, 0, 0, 0, 0, 0, 0, 0, 0],
-                     [0, 0, 0, 0, 0, 0, 0, 0, 0],
-                     [0, 0, 0, 0, 0, 0, 0, 0, 0],
-                     [0, 0, 0, 0, 0, 0, 0, 0, 0],
-                     [0, 0, 0, 0, 0, 0, 0, 0, 0],
-                     [0, 0, 0, 0, 0, 0, 0, 0, 0]]
+            rows = [file.readline().strip()]
+            size = len(rows[0])
+            rows += [file.readline().strip() for _ in range(size - 1)]
 
             # for each row in matrix
-            for i in range(9):
-                line = file.readline()
-                for j in range(9):
-                    value = int(line[j])
-                    if value != 0:
-                        board[i][j] = value
+            board = [[0] * size for _ in range(size)]
+            for i in range(size):
+                for j in range(size):
+                    board[i][j] = SYMBOL_VALUES[rows[i][j].upper()]
 
             sudokus.append(Sudoku(id, board))
 
 
+# Function that returns true if the string is a valid row or board for a size (digits, letters, or dots)
+# 1. text: string with the row or board
+# 2. size: integer with the number of values on the board
+def valid_symbols(text: str, size: int):
+    return all(SYMBOL_VALUES.get(c, size + 1) <= size for c in text.upper())
+
+
+# Function that reads sudokus from a file as a stream and yields tuples with the id and the encoded board
+# Supports the one line per board format (size ** 2 characters, 0 or . represent empty squares) and the "SUDOKU n"
+# block format, boards of 9x9, 16x16, and 25x25 are supported (values above 9 are written as letters)
+# One line boards are named "LINE n" after their line number, so their ids never collide with the block ids
+# Blocks that are not square boards of valid symbols are skipped and their ids are added to the rejected list
+# 1. filename: string with the path to the file
+# 2. rejected: list to keep track of the ids of the skipped sudokus (optional)
+def read_sudokus(filename: str, rejected: list = None):
+    number = 0
+    with open(filename, 'r') as file:
+        line = file.readline()
+        while line:
+            number += 1
+            line = line.strip()
+            box_size = isqrt(isqrt(len(line)))
+
+            # if line consists of box_size ** 4 symbols it represents a sudoku game
+            if box_size >= 2 and box_size ** 4 == len(line) and valid_symbols(line, box_size ** 2):
+                yield f"LINE {number}", line.upper().replace('.', '0').encode()
+
+            # if line consists of the word "SUDOKU" followed by a whitespace an integer the next lines are the board
+            elif line.startswith("SUDOKU ") and line[7:].isdigit():
+                rows = [file.readline().strip()]
+                size = len(rows[0])
+                rows += [file.readline().strip() for _ in range(size - 1)]
+                number += len(rows)
+                if isqrt(size) ** 2 == size and size >= 4 and \
+                   all(len(row) == size and valid_symbols(row, size) for row in rows):
+                    yield line, "".join(rows).upper().replace('.', '0').encode()
+                elif rejected is not None:
+                    rejected.append(line)
+            line = file.readline()
+
+
+# Function that writes solved boards to a file as a stream (one line of size ** 2 characters per board)
+# Boards that could not be solved are written unchanged followed by " UNSOLVED" to keep the input order
+# Returns a tuple with the number of written boards and the number of unsolved boards
+# 1. filename: string with the path to the file
+# 2. results: iterable of tuples with a boolean (true if solved) and the encoded board
+def write_sudokus(filename: str, results):
+    count = 0
+    unsolved = 0
+    with open(filename, 'w') as file:
+        for solved, data in results:
+            if solved:
+                file.write(data.decode() + "\n")
+            else:
+                file.write(data.decode() + " UNSOLVED\n")
+                unsolved += 1
+            count += 1
+    return count, unsolved
+
+
 # Function that solves the sudoku using backtracking
 # sudoku: Instance of the Sudoku class to keep track on the current board state
 def solve(sudoku: Sudoku):
@@ -113,8 +223,8 @@ def solve(sudoku: Sudoku):
 
     # Start looking for possible values for an empty board square using the lookup (row, column, box)
     i, j = sudoku.lookup_empty[0]  # row, column
-    k = (i // 3) + (j // 3) * 3  # box
-    for value in range(1, 10):
+    k = (i // sudoku.box_size) + (j // sudoku.box_size) * sudoku.box_size  # box
+    for value in range(1, sudoku.size + 1):
         # If value exists in lookup proceed to the next possible value
         if value in sudoku.lookup_rows[i] or\
            value in sudoku.lookup_columns[j] or\
@@ -148,19 +258,795 @@ def solve(sudoku: Sudoku):
     return False
 
 
+# Function that returns the bitmask lookups of a board (bit v - 1 is set when value v is used)
+# Returns a tuple with the row, column, and box bitmasks and a list of tuples (row, column, box) of the empty squares
+# board: list of list that contains integers to keep track of the board (0 represent empty squares)
+def bitmask_lookups(board: list):
+    size = len(board)
+    box_size = isqrt(size)
+    rows = [0] * size
+    columns = [0] * size
+    boxes = [0] * size
+    empty = []
+    for i in range(size):
+        for j in range(size):
+            value = board[i][j]
+            k = (i // box_size) + (j // box_size) * box_size
+            if value == 0:
+                empty.append((i, j, k))
+            else:
+                rows[i] |= 1 << (value - 1)
+                columns[j] |= 1 << (value - 1)
+                boxes[k] |= 1 << (value - 1)
+    return rows, columns, boxes, empty
+
+
+# Function that solves the sudoku using backtracking on bitmasks
+# Each step branches on the empty square with the fewest candidates (i.e. the most-constrained-cell ordering)
+# sudoku: Instance of the Sudoku class, the solution is written back to the board and the lookups
+def solve_bitmask(sudoku: Sudoku):
+    rows, columns, boxes, empty = bitmask_lookups(sudoku.board)
+    solved = search_bitmask(sudoku.board, rows, columns, boxes, empty)
+    if solved:
+        sudoku.update_lookups()
+    return solved
+
+
+# Function that finds the empty board square with the fewest candidates (stops early at zero or one candidate)
+# Returns a tuple with the index of the board square in the empty lookup and its candidates as a bitmask
+# 1. rows: list of integers that contains a bitmask of the used values in each row
+# 2. columns: list of integers that contains a bitmask of the used values in each column
+# 3. boxes: list of integers that contains a bitmask of the used values in each box
+# 4. empty: list of tuples (row, column, box) of the empty board squares
+def most_constrained(rows: list, columns: list, boxes: list, empty: list):
+    full = (1 << len(rows)) - 1
+    best_index = 0
+    best_count = len(rows) + 1
+    best_candidates = 0
+    for index, (i, j, k) in enumerate(empty):
+        candidates = full & ~(rows[i] | columns[j] | boxes[k])
+        count = candidates.bit_count()
+        if count < best_count:
+            best_index = index
+            best_count = count
+            best_candidates = candidates
+            if count <= 1:
+                break
+    return best_index, best_candidates
+
+
+# Function that performs the recursive search for solve_bitmask()
+# 1. board: list of list that contains integers to keep track of the board (0 represent empty squares)
+# 2. rows: list of integers that contains a bitmask of the used values in each row
+# 3. columns: list of integers that contains a bitmask of the used values in each column
+# 4. boxes: list of integers that contains a bitmask of the used values in each box
+# 5. empty: list of tuples (row, column, box) of the empty board squares
+def search_bitmask(board: list, rows: list, columns: list, boxes: list, empty: list):
+    # If there are no more empty board squares we have solved the sudoku
+    if len(empty) <= 0:
+        return True
+
+    # If the most constrained board square has no candidates the branch does not contain a solution
+    best_index, candidates = most_constrained(rows, columns, boxes, empty)
+    if candidates == 0:
+        return False
+
+    # Remove the board square from the empty lookup by swapping it with the last element
+    i, j, k = square = empty[best_index]
+    empty[best_index] = empty[-1]
+    empty.pop()
+
+    while candidates:
+        # Isolate the lowest set bit and update the board and the lookups accordingly
+        bit = candidates & -candidates
+        candidates ^= bit
+        board[i][j] = bit.bit_length()
+        rows[i] |= bit
+        columns[j] |= bit
+        boxes[k] |= bit
+
+        # Recursive call to explore deeper in the search tree
+        if search_bitmask(board, rows, columns, boxes, empty):
+            return True
+
+        # Otherwise, reset the lookups and proceed to the next candidate
+        rows[i] ^= bit
+        columns[j] ^= bit
+        boxes[k] ^= bit
+
+    # Reset the board square and restore the empty lookup to the order it had before the swap
+    board[i][j] = 0
+    if best_index < len(empty):
+        empty.append(empty[best_index])
+        empty[best_index] = square
+    else:
+        empty.append(square)
+    return False
+
+
+# Function that counts the solutions of a sudoku with the bitmask search and stops once the limit is reached
+# The board of the sudoku is not changed
+# 1. sudoku: Instance of the Sudoku class to keep track on the current board state
+# 2. limit: integer that determine the number of solutions to stop at (2 is enough to check uniqueness)
+# 3. statistics: dictionary to keep track of the number of visited search nodes (optional)
+def count_solutions(sudoku: Sudoku, limit: int = 2, statistics: dict = None):
+    board = [row[:] for row in sudoku.board]
+    rows, columns, boxes, empty = bitmask_lookups(board)
+    return count_bitmask(board, rows, columns, boxes, empty, limit, statistics if statistics is not None else dict())
+
+
+# Function that performs the recursive search for count_solutions() and returns the number of found solutions
+# 1. board: list of list that contains integers to keep track of the board (0 represent empty squares)
+# 2. rows: list of integers that contains a bitmask of the used values in each row
+# 3. columns: list of integers that contains a bitmask of the used values in each column
+# 4. boxes: list of integers that contains a bitmask of the used values in each box
+# 5. empty: list of tuples (row, column, box) of the empty board squares
+# 6. limit: integer that determine the number of solutions to stop at
+# 7. statistics: dictionary to keep track of the number of visited search nodes
+def count_bitmask(board: list, rows: list, columns: list, boxes: list, empty: list, limit: int, statistics: dict):
+    statistics["nodes"] = statistics.get("nodes", 0) + 1
+    if len(empty) <= 0:
+        return 1
+
+    best_index, candidates = most_constrained(rows, columns, boxes, empty)
+    if candidates == 0:
+        return 0
+
+    i, j, k = square = empty[best_index]
+    empty[best_index] = empty[-1]
+    empty.pop()
+
+    count = 0
+    while candidates and count < limit:
+        bit = candidates & -candidates
+        candidates ^= bit
+        board[i][j] = bit.bit_length()
+        rows[i] |= bit
+        columns[j] |= bit
+        boxes[k] |= bit
+        count += count_bitmask(board, rows, columns, boxes, empty, limit - count, statistics)
+        rows[i] ^= bit
+        columns[j] ^= bit
+        boxes[k] ^= bit
+
+    board[i][j] = 0
+    if best_index < len(empty):
+        empty.append(empty[best_index])
+        empty[best_index] = square
+    else:
+        empty.append(square)
+    return count
+
+
+# Function that returns a randomly generated, completely filled board
+# The diagonal boxes are independent, so they are filled with random permutations before the board is solved
+# (with constraint propagation, since the plain bitmask search can take minutes on some 25x25 boards)
+# box_size: integer that determine the width of a box (3 for 9x9, 4 for 16x16, and 5 for 25x25)
+def generate_grid(box_size: int = 3):
+    size = box_size ** 2
+    board = [[0] * size for _ in range(size)]
+    for b in range(box_size):
+        values = list(range(1, size + 1))
+        random.shuffle(values)
+        for c in range(size):
+            board[b * box_size + c // box_size][b * box_size + c % box_size] = values[c]
+    solve_propagation(Sudoku("", board), dict())
+    return board
+
+
+# Function that rates the difficulty of a sudoku based on the search effort needed to prove its uniqueness
+# Returns a tuple with the rating ("EASY", "MEDIUM", "HARD", or "EXPERT") and the number of search nodes
+# sudoku: Instance of the Sudoku class to keep track on the current board state
+def rate_difficulty(sudoku: Sudoku):
+    statistics = dict()
+    count_solutions(sudoku, 2, statistics)
+    # Every empty square needs at least one node, so only the nodes beyond that are considered as search effort
+    effort = statistics["nodes"] - len(sudoku.lookup_empty) - 1
+    if effort <= 5:
+        rating = "EASY"
+    elif effort <= 50:
+        rating = "MEDIUM"
+    elif effort <= 500:
+        rating = "HARD"
+    else:
+        rating = "EXPERT"
+    return rating, statistics["nodes"]
+
+
+# Function that generates a sudoku with a unique solution by removing clues from a randomly filled board
+# A clue is only removed if the sudoku still has exactly one solution afterwards, which is the case if the board
+# has no solution when the removed value is excluded from the candidates of the emptied board square
+# The check uses the constraint propagation search, so it also stays fast for 16x16 and 25x25 boards
+# 1. id: string as a unique identifier
+# 2. minimum_clues: integer that determine the number of clues to stop at (raised to the floor of the box size)
+# 3. box_size: integer that determine the width of a box (3 for 9x9, 4 for 16x16, and 5 for 25x25)
+def generate_sudoku(id: str, minimum_clues: int = 17, box_size: int = 3):
+    size = box_size ** 2
+    minimum_clues = max(minimum_clues, CLUE_FLOORS.get(box_size, 0))
+    _, _, cell_units, _ = lookups = unit_lookups(box_size)
+    values = [value for row in generate_grid(box_size) for value in row]
+    placed = [(1 << size) - 1] * (3 * size)
+    cells = list(range(size * size))
+    random.shuffle(cells)
+    clues = size * size
+    for cell in cells:
+        if clues <= minimum_clues:
+            break
+        value = values[cell]
+        bit = 1 << (value - 1)
+        values[cell] = 0
+        for unit in cell_units[cell]:
+            placed[unit] ^= bit
+        candidates = candidate_masks([values[i * size:i * size + size] for i in range(size)])
+        candidates[cell] &= ~bit
+        if search_propagation(values[:], candidates, placed[:], lookups, dict()) is None:
+            clues -= 1
+        else:
+            values[cell] = value
+            for unit in cell_units[cell]:
+                placed[unit] |= bit
+    return Sudoku(id, [values[i * size:i * size + size] for i in range(size)])
+
+
+# Function that returns the candidates of each board square as bitmasks (filled board squares have no candidates)
+# board: list of list that contains integers to keep track of the board (0 represent empty squares)
+def candidate_masks(board: list):
+    size = len(board)
+    rows, columns, boxes, empty = bitmask_lookups(board)
+    candidates = [0] * (size * size)
+    for i, j, k in empty:
+        candidates[i * size + j] = ((1 << size) - 1) & ~(rows[i] | columns[j] | boxes[k])
+    return candidates
+
+
+# Function that places a value on the board and removes it from the candidates of the peers
+# 1. values: list of integers to keep track of the board square values (row * size + column, 0 represent empty squares)
+# 2. candidates: list of integers that contains the candidates of each board square as bitmasks
+# 3. placed: list of integers that contains a bitmask of the placed values in each unit
+# 4. lookups: tuple with the unit lookups of the box size (see unit_lookups)
+# 5. cell: integer index (row * size + column) of the board square
+# 6. value: integer value to place on the board square
+def place(values: list, candidates: list, placed: list, lookups: tuple, cell: int, value: int):
+    _, peers, cell_units, _ = lookups
+    bit = 1 << (value - 1)
+    values[cell] = value
+    candidates[cell] = 0
+    for unit in cell_units[cell]:
+        placed[unit] |= bit
+    for peer in peers[cell]:
+        candidates[peer] &= ~bit
+
+
+# Function that removes candidates from board squares and returns the number of removed candidates
+# 1. candidates: list of integers that contains the candidates of each board square as bitmasks
+# 2. cells: list of integer indices (row * size + column) of the board squares
+# 3. mask: integer bitmask of the candidates to remove
+def eliminate(candidates: list, cells: list, mask: int):
+    removed = 0
+    for cell in cells:
+        if candidates[cell] & mask:
+            removed += (candidates[cell] & mask).bit_count()
+            candidates[cell] &= ~mask
+    return removed
+
+
+# Function that fills and eliminates candidates using logic rules until nothing changes
+# Returns false if a contradiction was found (i.e. an empty board square or a value in a unit without candidates)
+# 1. values: list of integers to keep track of the board square values (row * size + column, 0 represent empty squares)
+# 2. candidates: list of integers that contains the candidates of each board square as bitmasks
+# 3. placed: list of integers that contains a bitmask of the placed values in each unit
+# 4. lookups: tuple with the unit lookups of the box size (see unit_lookups)
+# 5. statistics: dictionary to keep track of how many cells or candidates each rule resolved
+def propagate(values: list, candidates: list, placed: list, lookups: tuple, statistics: dict):
+    units, _, _, intersections = lookups
+    full = (1 << len(units[0])) - 1
+    changed = True
+    while changed:
+        changed = False
+
+        # Naked singles: an empty board square with only one candidate
+        for cell in range(len(values)):
+            if values[cell] == 0:
+                mask = candidates[cell]
+                if mask == 0:
+                    return False
+                if mask & (mask - 1) == 0:
+                    place(values, candidates, placed, lookups, cell, mask.bit_length())
+                    statistics["naked singles"] = statistics.get("naked singles", 0) + 1
+                    changed = True
+
+        # Hidden singles: a value that only has one possible board square in a unit
+        # once/twice: bitmasks of the values that are candidates in at least one/two board squares of the unit
+        for index, unit in enumerate(units):
+            once = 0
+            twice = 0
+            for cell in unit:
+                twice |= once & candidates[cell]
+                once |= candidates[cell]
+            if full & ~(placed[index] | once):
+                return False
+
+            hidden = once & ~twice
+            while hidden:
+                bit = hidden & -hidden
+                hidden ^= bit
+                cells = [cell for cell in unit if candidates[cell] & bit]
+                if len(cells) == 0:
+                    return False
+                place(values, candidates, placed, lookups, cells[0], bit.bit_length())
+                statistics["hidden singles"] = statistics.get("hidden singles", 0) + 1
+                changed = True
+
+        # Only use the intersection rules when the singles are depleted
+        if changed:
+            continue
+
+        # Pointing pairs: a value that is confined to one line inside a box is removed from the rest of the line
+        # Box/line reduction: a value that is confined to one box inside a line is removed from the rest of the box
+        for segment, line_rest, box_rest in intersections:
+            inside = 0
+            for cell in segment:
+                inside |= candidates[cell]
+            if inside == 0:
+                continue
+            outside_line = 0
+            for cell in line_rest:
+                outside_line |= candidates[cell]
+            outside_box = 0
+            for cell in box_rest:
+                outside_box |= candidates[cell]
+
+            removed = eliminate(candidates, line_rest, inside & ~outside_box)
+            if removed:
+                statistics["pointing pairs"] = statistics.get("pointing pairs", 0) + removed
+                changed = True
+            removed = eliminate(candidates, box_rest, inside & ~outside_line)
+            if removed:
+                statistics["box/line reduction"] = statistics.get("box/line reduction", 0) + removed
+                changed = True
+
+    return True
+
+
+# Function that solves the sudoku using constraint propagation before and during backtracking
+# 1. sudoku: Instance of the Sudoku class, the solution is written back to the board and the lookups
+# 2. statistics: dictionary to keep track of how many cells or candidates each rule resolved along the solution path,
+#    the guesses made on the solution path, and the guesses made in branches that failed
+def solve_propagation(sudoku: Sudoku, statistics: dict):
+    size = sudoku.size
+    lookups = unit_lookups(sudoku.box_size)
+    values = [value for row in sudoku.board for value in row]
+    placed = [0] * (3 * size)
+    for cell in range(size * size):
+        if values[cell] != 0:
+            for unit in lookups[2][cell]:
+                placed[unit] |= 1 << (values[cell] - 1)
+
+    values = search_propagation(values, candidate_masks(sudoku.board), placed, lookups, statistics)
+    if values is None:
+        return False
+
+    for i in range(size):
+        sudoku.board[i][:] = values[i * size:i * size + size]
+    sudoku.update_lookups()
+    return True
+
+
+# Function that performs the recursive search for solve_propagation() and returns the solved values (or None)
+# The rule counts of a branch are only merged into the statistics if the branch contains the solution
+# 1. values: list of integers to keep track of the board square values (row * size + column, 0 represent empty squares)
+# 2. candidates: list of integers that contains the candidates of each board square as bitmasks
+# 3. placed: list of integers that contains a bitmask of the placed values in each unit
+# 4. lookups: tuple with the unit lookups of the box size (see unit_lookups)
+# 5. statistics: dictionary to keep track of the work done in the current branch
+def search_propagation(values: list, candidates: list, placed: list, lookups: tuple, statistics: dict):
+    if not propagate(values, candidates, placed, lookups, statistics):
+        return None
+
+    # Find the empty board square with the fewest candidates (stop early if it has two candidates)
+    best_cell = -1
+    best_count = len(placed)
+    for cell in range(len(values)):
+        if values[cell] == 0:
+            count = candidates[cell].bit_count()
+            if count < best_count:
+                best_cell = cell
+                best_count = count
+                if count <= 2:
+                    break
+
+    # If there are no more empty board squares we have solved the sudoku
+    if best_cell < 0:
+        return values
+
+    # The guesses are (board square, value) pairs, either the candidates of the board square or the two possible
+    # board squares of a value in a unit (used when the board square has more than two candidates)
+    guesses = []
+    remaining = candidates[best_cell]
+    while remaining:
+        bit = remaining & -remaining
+        remaining ^= bit
+        guesses.append((best_cell, bit.bit_length()))
+    if best_count > 2:
+        for unit in lookups[0]:
+            once = 0
+            twice = 0
+            thrice = 0
+            for cell in unit:
+                thrice |= twice & candidates[cell]
+                twice |= once & candidates[cell]
+                once |= candidates[cell]
+            pairs = twice & ~thrice
+            if pairs:
+                bit = pairs & -pairs
+                guesses = [(cell, bit.bit_length()) for cell in unit if candidates[cell] & bit]
+                break
+
+    # Make each guess on a copy of the state and explore deeper in the search tree
+    for cell, value in guesses:
+        branch = dict()
+        values_copy = values[:]
+        candidates_copy = candidates[:]
+        placed_copy = placed[:]
+        place(values_copy, candidates_copy, placed_copy, lookups, cell, value)
+        result = search_propagation(values_copy, candidates_copy, placed_copy, lookups, branch)
+        if result is not None:
+            statistics["guesses"] = statistics.get("guesses", 0) + 1
+            for key, count in branch.items():
+                statistics[key] = statistics.get(key, 0) + count
+            return result
+        statistics["failed guesses"] = statistics.get("failed guesses", 0) + 1 + \
+            branch.get("guesses", 0) + branch.get("failed guesses", 0)
+    return None
+
+
+# DancingLinks: Class that represent an exact cover matrix as circular doubly linked lists (Knuth's Algorithm X)
+# The nodes are stored as indices in parallel lists, node 0 is the root and nodes 1..columns are the column headers
+# left, right, up, down: lists of integers to keep track of the neighbouring nodes
+# column: list of integers to keep track of the column header of each node
+# row: list of integers to keep track of the row identifier of each node
+# size: list of integers to keep track of the number of nodes in each column
+class DancingLinks:
+    def __init__(self, columns: int):
+        self.left = [columns] + list(range(columns))
+        self.right = list(range(1, columns + 1)) + [0]
+        self.up = list(range(columns + 1))
+        self.down = list(range(columns + 1))
+        self.column = list(range(columns + 1))
+        self.row = [-1] * (columns + 1)
+        self.size = [0] * (columns + 1)
+
+    # Add a row that covers the given columns (0-based column indices)
+    def add_row(self, row: int, columns: list):
+        first = -1
+        for c in columns:
+            header = c + 1
+            node = len(self.column)
+            self.column.append(header)
+            self.row.append(row)
+
+            # Insert the node at the bottom of the column
+            self.up.append(self.up[header])
+            self.down.append(header)
+            self.down[self.up[header]] = node
+            self.up[header] = node
+            self.size[header] += 1
+
+            # Insert the node at the end of the row
+            if first < 0:
+                first = node
+                self.left.append(node)
+                self.right.append(node)
+            else:
+                self.left.append(self.left[first])
+                self.right.append(first)
+                self.right[self.left[first]] = node
+                self.left[first] = node
+
+    # Remove a column header and every row that intersects the column
+    def cover(self, c: int):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        right[left[c]] = right[c]
+        left[right[c]] = left[c]
+        i = down[c]
+        while i != c:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    # Restore a column header and every row that intersects the column (in the reverse order of cover())
+    def uncover(self, c: int):
+        left, right, up, down, column, size = self.left, self.right, self.up, self.down, self.column, self.size
+        i = up[c]
+        while i != c:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[c]] = c
+        left[right[c]] = c
+
+    # Search for an exact cover, the row identifiers are appended to the solution (the matrix is restored afterwards)
+    def search(self, solution: list):
+        right, left, down, column, size = self.right, self.left, self.down, self.column, self.size
+
+        # If there are no more columns every constraint is satisfied
+        if right[0] == 0:
+            return True
+
+        # Choose the column with the fewest rows
+        best = right[0]
+        c = right[best]
+        while c != 0:
+            if size[c] < size[best]:
+                best = c
+            c = right[c]
+        if size[best] == 0:
+            return False
+
+        self.cover(best)
+        found = False
+        r = down[best]
+        while r != best and not found:
+            solution.append(self.row[r])
+            j = right[r]
+            while j != r:
+                self.cover(column[j])
+                j = right[j]
+
+            found = self.search(solution)
+
+            j = left[r]
+            while j != r:
+                self.uncover(column[j])
+                j = left[j]
+            if not found:
+                solution.pop()
+            r = down[r]
+        self.uncover(best)
+        return found
+
+
+# Function that solves the sudoku as an exact cover problem with Dancing Links
+# The 4 * size ** 2 columns (324 for 9x9) are the constraints: each square filled, and each value once per row,
+# column, and box, and the rows are the candidate placements (row * size + column) * size + value - 1
+# sudoku: Instance of the Sudoku class, the solution is written back to the board and the lookups
+def solve_dlx(sudoku: Sudoku):
+    size = sudoku.size
+    cells = size * size
+    matrix = DancingLinks(4 * cells)
+    candidates = candidate_masks(sudoku.board)
+    for i in range(size):
+        for j in range(size):
+            k = (i // sudoku.box_size) + (j // sudoku.box_size) * sudoku.box_size
+            for value in range(1, size + 1):
+                if sudoku.board[i][j] == value or candidates[i * size + j] & (1 << (value - 1)):
+                    matrix.add_row((i * size + j) * size + value - 1,
+                                   [i * size + j,
+                                    cells + i * size + value - 1,
+                                    2 * cells + j * size + value - 1,
+                                    3 * cells + k * size + value - 1])
+
+    solution = []
+    if not matrix.search(solution):
+        return False
+
+    for row in solution:
+        cell, value = divmod(row, size)
+        sudoku.board[cell // size][cell % size] = value + 1
+    sudoku.update_lookups()
+    return True
+
+
+# Function that solves the sudoku with the chosen engine
+# 1. sudoku: Instance of the Sudoku class, the solution is written back to the board and the lookups
+# 2. engine: string to keep track on the used engine ("BACKTRACKING", "BITMASK", "PROPAGATION", or "DLX")
+# 3. statistics: dictionary to keep track of the work done by the "PROPAGATION" engine (optional)
+def solve_sudoku(sudoku: Sudoku, engine: str, statistics: dict = None):
+    if engine.upper() == "BACKTRACKING":
+        return solve(sudoku)
+    elif engine.upper() == "BITMASK":
+        return solve_bitmask(sudoku)
+    elif engine.upper() == "PROPAGATION":
+        return solve_propagation(sudoku, statistics if statistics is not None else dict())
+    elif engine.upper() == "DLX":
+        return solve_dlx(sudoku)
+    raise Exception(f"Error! \"{engine}\" is not an implemented sudoku engine.\n"
+                    f"Option 1: \"BACKTRACKING\" to use backtracking on list lookups.\n"
+                    f"Option 2: \"BITMASK\" to use backtracking on bitmasks with the most-constrained-cell ordering.\n"
+                    f"Option 3: \"PROPAGATION\" to use constraint propagation during backtracking.\n"
+                    f"Option 4: \"DLX\" to use Dancing Links on an exact cover matrix.\n")
+
+
+# Function that encodes a board as size ** 2 bytes (81 for 9x9), one ASCII symbol per board square, row-wise
+# board: list of list that contains integers to keep track of the board (0 represent empty squares)
+def encode_board(board: list):
+    return "".join(SYMBOLS[value] for row in board for value in row).encode()
+
+
+# Function that decodes size ** 2 bytes (81 for 9x9), one ASCII symbol per board square, row-wise, into a board
+# data: bytes of the encoded board
+def decode_board(data: bytes):
+    size = isqrt(len(data))
+    text = data.decode()
+    return [[SYMBOL_VALUES[text[i * size + j]] for j in range(size)] for i in range(size)]
+
+
+# Function that solves an encoded board (used by the worker processes in the batch mode)
+# Returns a tuple with a boolean (true if solved), the encoded solution, and the latency in seconds
+# 1. data: bytes of the encoded board
+# 2. engine: string to keep track on the used engine (see solve_sudoku)
+def solve_encoded(data: bytes, engine: str):
+    start_time = time.perf_counter()
+    sudoku = Sudoku("", decode_board(data))
+    solved = solve_sudoku(sudoku, engine)
+    return solved, encode_board(sudoku.board), time.perf_counter() - start_time
+
+
+# Function that solves encoded boards across a process pool, the results are yielded in input order
+# The boards are consumed in windows (two windows in flight) so the memory usage stays flat for streamed input
+# 1. boards: iterable of bytes with encoded boards
+# 2. engine: string to keep track on the used engine (see solve_sudoku)
+# 3. processes: integer that determine the number of worker processes
+# 4. chunk_size: integer that determine the number of boards sent to a worker at a time
+def solve_batch(boards, engine: str, processes: int, chunk_size: int):
+    boards = iter(boards)
+    window_size = chunk_size * processes * 4
+    worker = partial(solve_encoded, engine=engine)
+    with Pool(processes) as pool:
+        window = list(islice(boards, window_size))
+        pending = pool.map_async(worker, window, chunksize=chunk_size) if window else None
+        while pending is not None:
+            window = list(islice(boards, window_size))
+            upcoming = pool.map_async(worker, window, chunksize=chunk_size) if window else None
+            for result in pending.get():
+                yield result
+            pending = upcoming
+
+
+# Function that records the latency of each result from solve_batch() and yields the solved flag and the board
+# 1. results: iterable of tuples from solve_batch()
+# 2. latencies: array to keep track of the latencies in seconds
+def record_latencies(results, latencies: array):
+    for solved, data, latency in results:
+        latencies.append(latency)
+        yield solved, data
+
+
+# Function that returns the value at a percentile (nearest-rank method) of a sorted list
+# 1. values: sorted list of numbers
+# 2. percentage: float value between 0 and 100
+def percentile(values: list, percentage: float):
+    if len(values) == 0:
+        return 0.0
+    rank = max(1, -(-len(values) * percentage // 100))
+    return values[int(rank) - 1]
+
+
+# Function that prints the throughput and the p50/p99 latency of a batch of solved sudokus
+# 1. mode: string with the name of the mode that is reported
+# 2. latencies: list of floats with the latency of each sudoku in seconds
+# 3. elapsed_time: float value with the total execution time in seconds
+def print_batch_statistics(mode: str, latencies: list, elapsed_time: float):
+    latencies = sorted(latencies)
+    print(f"{(mode + ' throughput').ljust(34, '.')}: {(len(latencies) / elapsed_time):.5f} puzzles/second")
+    print(f"{(mode + ' p50 latency').ljust(34, '.')}: {(percentile(latencies, 50) * 10 ** 3):.5f} milliseconds")
+    print(f"{(mode + ' p99 latency').ljust(34, '.')}: {(percentile(latencies, 99) * 10 ** 3):.5f} milliseconds")
+
+
 # Entry point of the code
 if __name__ == "__main__":
-    parameters = dict()
-    sudokus = []
-    specification(parameters, sudokus)
-
-    # Solve the sudokus and measure the required execution time
-    start_time = time.time()
-    for sudoku in sudokus:
-        solve(sudoku)
-    end_time = time.time()
-
-    # Display the solved sudoku games
-    for sudoku in sudokus:
-        print(sudoku)
-    print(f"Backtracking execution time.......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
\ No newline at end of file
+    # Sudoku Solver Parameters
+    engine = "DLX"
+    engines = {"BACKTRACKING": "Backtracking", "BITMASK": "Bitmask", "PROPAGATION": "Propagation", "DLX": "Dancing Links"}
+    benchmark = False  # Solve the sudokus with every engine and compare the execution times
+    display = True  # Pretty-print the solved sudoku games
+    batch = False  # Solve the input file across a process pool and report the throughput and latencies
+    streaming = False  # Solve the input file as a stream and write the compact solutions to the output file
+    generating = False  # Generate sudokus with unique solutions and write them to the output file
+    generated_sudokus = 1000
+    input_file = "input.txt"  # "input_16x16.txt" contains 16x16 sudokus in the same format
+    output_file = "output.txt"
+    processes = os.cpu_count()
+    chunk_size = 64
+
+    # Solve the input file as a stream (without keeping the boards in memory) and write the solutions to the output file
+    if streaming:
+        rejected = []
+        latencies = array('d')
+        start_time = time.time()
+        boards = (data for _, data in read_sudokus(input_file, rejected))
+        results = record_latencies(solve_batch(boards, engine, processes, chunk_size), latencies)
+        count, unsolved = write_sudokus(output_file, results)
+        end_time = time.time()
+        print(f"Streaming mode processes..........: {processes}")
+        print(f"Streaming mode solved.............: {count - unsolved} of {count} (rejected {len(rejected)})")
+        print_batch_statistics("Streaming mode", latencies, end_time - start_time)
+
+    # Generate sudokus with unique solutions, rate their difficulty, and write them to the output file
+    elif generating:
+        ratings = dict()
+        start_time = time.time()
+        generated = []
+        for n in range(1, generated_sudokus + 1):
+            sudoku = generate_sudoku(f"SUDOKU {n}")
+            rating, nodes = rate_difficulty(sudoku)
+            ratings[rating] = ratings.get(rating, 0) + 1
+            generated.append(encode_board(sudoku.board))
+            if display:
+                print(f"{sudoku.id} ({rating}, {nodes} search nodes)")
+                print(sudoku)
+        end_time = time.time()
+        write_sudokus(output_file, ((True, data) for data in generated))
+        print(f"Generated sudokus.................: {generated_sudokus}")
+        print(f"Generated sudokus per minute......: {(generated_sudokus / (end_time - start_time) * 60):.5f}")
+        for rating in ["EASY", "MEDIUM", "HARD", "EXPERT"]:
+            print(f"{(rating.capitalize() + ' sudokus').ljust(34, '.')}: {ratings.get(rating, 0)}")
+
+    # Solve the sudokus in the input file in batch mode across a process pool
+    elif batch:
+        rejected = []
+        puzzles = list(read_sudokus(input_file, rejected))
+        start_time = time.time()
+        results = list(solve_batch((data for _, data in puzzles), engine, processes, chunk_size))
+        end_time = time.time()
+        if display:
+            for (id, _), (_, data, _) in zip(puzzles, results):
+                print(Sudoku(id, decode_board(data)))
+        for id in rejected:
+            print(f"Warning! {id} is not a square board of valid symbols and was skipped.")
+        for (id, _), (solved, _, _) in zip(puzzles, results):
+            if not solved:
+                print(f"Warning! {id} has no solution.")
+        print(f"Batch mode processes..............: {processes}")
+        print_batch_statistics("Batch mode", [latency for _, _, latency in results], end_time - start_time)
+
+    # Solve the sudokus in the input file one after another
+    else:
+        parameters = dict()
+        sudokus = []
+        specification(parameters, sudokus, input_file)
+
+        # Solve the sudokus with the chosen engine, or with every engine (on copies of the boards) when benchmarking,
+        # and measure the required execution times
+        solutions = dict()
+        execution_times = dict()
+        statistics_propagation = []
+        used_engines = list(engines) if benchmark else [engine.upper()]
+        for name in used_engines:
+            solutions[name] = [sudoku.copy() for sudoku in sudokus]
+            start_time = time.time()
+            for sudoku in solutions[name]:
+                statistics = dict()
+                solve_sudoku(sudoku, name, statistics)
+                if name == "PROPAGATION":
+                    statistics_propagation.append(statistics)
+            end_time = time.time()
+            execution_times[name] = end_time - start_time
+
+        # Display the sudoku games solved by the chosen engine
+        if display:
+            for sudoku in solutions[engine.upper()]:
+                print(sudoku)
+        for sudoku, statistics in zip(sudokus, statistics_propagation):
+            print(f"{sudoku.id}: "
+                  f"naked singles {statistics.get('naked singles', 0)}, "
+                  f"hidden singles {statistics.get('hidden singles', 0)}, "
+                  f"pointing pairs {statistics.get('pointing pairs', 0)}, "
+                  f"box/line reduction {statistics.get('box/line reduction', 0)}, "
+                  f"guesses {statistics.get('guesses', 0)}, "
+                  f"failed guesses {statistics.get('failed guesses', 0)}")
+        for name in used_engines:
+            print(f"{(engines[name] + ' execution time').ljust(34, '.')}: "
+                  f"{(execution_times[name] * 10 ** 3):.5f} milliseconds")
+        for name in used_engines:
+            if any(a.board != b.board for a, b in zip(solutions[engine.upper()], solutions[name])):
+                print(f"Warning! The solutions of the \"{engine}\" and \"{name}\" engines differ.")
+
@@ -2,6 +2,11 @@ import re  # Used for interpreting the input file
 import time  # Used for measuring the execution time
 import tracemalloc  # Used for measuring the peak memory usage
 from collections import deque  # used for simulating a stack
+import heapq  # Used for the priority queue in the best-first branch and bound
+from bisect import bisect_right  # Used for the binary search in the meet-in-the-middle
+import os  # Used for getting the number of processors
+from multiprocessing import Pool, Value  # Used for searching subtrees in parallel and sharing the best benefit
+import numpy as np  # Used for the rolling array in the dynamic programming
 
 
 # Item: class that represent items
@@ -46,6 +51,26 @@ class Node:
                f"Depth............: {self.depth}\n"
 
 
+# CompactNode: class that represent possible solutions with a small memory footprint (used by the compact search)
+# 1. chosen: integer bitmask to keep track on the items in knapsack (bit i is set if the item at index i is chosen)
+# 2. total_benefit: integer to keep track of the summarized benefit of all chosen items
+# 3. total_weight: integer to keep track of the summarized weight of all chosen items
+# 4. depth: integer to keep track of current depth in the search (tree structure)
+class CompactNode:
+    __slots__ = ("chosen", "total_benefit", "total_weight", "depth")
+
+    def __init__(self, chosen: int, total_benefit: int, total_weight: int, depth: int):
+        self.chosen = chosen
+        self.total_benefit = total_benefit
+        self.total_weight = total_weight
+        self.depth = depth
+
+    # Return an instance of the Node class with the list of chosen items (only used for the final solution)
+    def to_node(self, items: list):
+        return Node([item.id for i, item in enumerate(items) if self.chosen >> i & 1],
+                    self.total_benefit, self.total_weight, self.depth)
+
+
 # Function that interpret the problem specification from "input.txt"
 # 1. parameters: dictionary to keep track of parameters (only "MAXIMUM WEIGHT" is relevant in our case)
 # 2. items: list to keep track of instances of the Item class
@@ -75,7 +100,12 @@ def specification(parameters: dict, items: list):
 # 1. items: list to keep track of instances of the Item class
 # 2. max_weight: integer to keep track on the maximum weight of the knapsack
 # 3. algorithm: string to keep track on used algorithm (should contain either "BFS" or "DFS")
-def uninformed_search(items: list, max_weight: int, algorithm: str):
+# 4. statistics: dictionary to keep track of the number of expanded nodes (optional)
+# 5. compact: boolean that determine if the nodes are instances of the CompactNode class (chosen items as a bitmask)
+def uninformed_search(items: list, max_weight: int, algorithm: str, statistics: dict = None, compact: bool = False):
+    if statistics is None:
+        statistics = dict()
+
     # Choose which algorithm to use
     if algorithm.upper() != "BFS" and algorithm.upper() != "DFS":
         raise Exception(f"Error! \"{algorithm}\" is not an implemented search algorithm.\n"
@@ -83,7 +113,7 @@ def uninformed_search(items: list, max_weight: int, algorithm: str):
                         f"Option 2: \"DFS\" to use depth-first search.\n")
 
     # Node to keep track of the solution with the best benefit value, start with empty an empty knapsack
-    node_solution = Node([], 0, 0, 0)
+    node_solution = CompactNode(0, 0, 0, 0) if compact else Node([], 0, 0, 0)
 
     # Node queue/stack to keep track of nodes to search, start with empty an empty knapsack
     nodes = deque()
@@ -96,6 +126,7 @@ def uninformed_search(items: list, max_weight: int, algorithm: str):
             node = nodes.popleft()  # FIFO: append() increment on the right side, and popleft() remove left side
         else:
             node = nodes.pop()  # LIFO: append() increment on the right side, and pop() removes on the right side
+        statistics["nodes expanded"] = statistics.get("nodes expanded", 0) + 1
 
         # Update solution node if the benefit of the current node is higher
         # Choose solution with the least weight if they have equal benefit
@@ -105,7 +136,17 @@ def uninformed_search(items: list, max_weight: int, algorithm: str):
             node_solution = node
 
         # Continue search if there are still more items to potentially put in the knapsack
-        if node.depth < len(items):
+        if node.depth < len(items) and compact:
+            item = items[node.depth]
+            # Scenario 1 and 2 for the compact nodes: take item (set the bit of the item), and do not take item
+            if node.total_weight + item.weight <= max_weight:
+                nodes.append(CompactNode(node.chosen | (1 << node.depth),
+                                         node.total_benefit + item.benefit,
+                                         node.total_weight + item.weight,
+                                         node.depth + 1))
+            nodes.append(CompactNode(node.chosen, node.total_benefit, node.total_weight, node.depth + 1))
+
+        elif node.depth < len(items):
             item = items[node.depth]
             # Scenario 1: take item
             child_left = Node(
@@ -128,7 +169,381 @@ def uninformed_search(items: list, max_weight: int, algorithm: str):
             else:
                 nodes.append(child_right)
 
-    return node_solution
+    return node_solution.to_node(items) if compact else node_solution
+
+
+# Function that creates the solution node from the indices of the chosen items
+# The depth is the depth where the search tree first reaches the solution (i.e. after the last chosen item)
+# 1. items: list to keep track of instances of the Item class
+# 2. chosen_indices: list of integers to keep track on the indices of the chosen items in the item list
+def create_solution_node(items: list, chosen_indices: list):
+    chosen_indices = sorted(chosen_indices)
+    return Node(
+        chosen_items=[items[i].id for i in chosen_indices],
+        total_benefit=sum(items[i].benefit for i in chosen_indices),
+        total_weight=sum(items[i].weight for i in chosen_indices),
+        depth=chosen_indices[-1] + 1 if chosen_indices else 0)
+
+
+# Function that finds a solution using dynamic programming in O(n * max_weight) time
+# The "ARRAY" variant keeps the best benefit for each capacity in a rolling 1-D array and one row of decisions per item
+# The "SPARSE" variant keeps a dictionary of the non-dominated (weight, benefit) states, so it does not depend on
+# the capacity and can be used for huge maximum weights
+# Choose solution with the least weight if there are several with the best benefit (same as uninformed_search)
+# 1. items: list to keep track of instances of the Item class
+# 2. max_weight: integer to keep track on the maximum weight of the knapsack
+# 3. algorithm: string to keep track on used variant (should contain either "ARRAY" or "SPARSE")
+def dynamic_programming(items: list, max_weight: int, algorithm: str):
+    if algorithm.upper() == "ARRAY":
+        # best[c]: the best benefit with a total weight of at most c
+        # keep[i][c]: true if item i is taken in the best solution of the first i + 1 items with capacity c
+        best = np.zeros(max_weight + 1, dtype=np.int64)
+        keep = np.zeros((len(items), max_weight + 1), dtype=bool)
+        for i, item in enumerate(items):
+            if item.weight > max_weight:
+                continue
+            candidate = best[:max_weight + 1 - item.weight] + item.benefit
+            take = candidate > best[item.weight:]
+            keep[i, item.weight:] = take
+            best[item.weight:] = np.where(take, candidate, best[item.weight:])
+
+        # The least capacity that reaches the best benefit is the least weight of a best solution
+        capacity = int(np.argmax(best == best[max_weight]))
+        chosen_indices = []
+        for i in range(len(items) - 1, -1, -1):
+            if keep[i, capacity]:
+                chosen_indices.append(i)
+                capacity -= items[i].weight
+        return create_solution_node(items, chosen_indices)
+
+    elif algorithm.upper() == "SPARSE":
+        # The heaviest remaining state has the best benefit, and the least weight among the solutions with it
+        states = sparse_states(items, max_weight)
+        _, chain = states[max(states)]
+        return create_solution_node(items, chain_indices(chain))
+
+    raise Exception(f"Error! \"{algorithm}\" is not an implemented dynamic programming variant.\n"
+                    f"Option 1: \"ARRAY\" to use a rolling array over the capacities.\n"
+                    f"Option 2: \"SPARSE\" to use a dictionary of the non-dominated states.\n")
+
+
+# Function that returns the non-dominated states of the sparse dynamic programming as a hashmap sorted by weight
+# Each state maps a total weight to a tuple (total benefit, chosen item chain) where the chain is a nested tuple
+# (item index, previous chain) that is shared between the states, a heavier state has a strictly higher benefit
+# 1. items: list to keep track of instances of the Item class
+# 2. max_weight: integer to keep track on the maximum weight of the knapsack
+def sparse_states(items: list, max_weight: int):
+    states = {0: (0, None)}
+    for i, item in enumerate(items):
+        new_states = dict(states)
+        for weight, (benefit, chain) in states.items():
+            if weight + item.weight <= max_weight:
+                state = new_states.get(weight + item.weight)
+                if state is None or state[0] < benefit + item.benefit:
+                    new_states[weight + item.weight] = (benefit + item.benefit, (i, chain))
+
+        # Remove the dominated states (a heavier state needs a strictly higher benefit)
+        states = dict()
+        best_benefit = -1
+        for weight in sorted(new_states):
+            if new_states[weight][0] > best_benefit:
+                states[weight] = new_states[weight]
+                best_benefit = new_states[weight][0]
+    return states
+
+
+# Function that returns the item indices of a chosen item chain (see sparse_states)
+def chain_indices(chain: tuple):
+    chosen_indices = []
+    while chain is not None:
+        chosen_indices.append(chain[0])
+        chain = chain[1]
+    return chosen_indices
+
+
+# CapacityTable: class that answers knapsack queries for any capacity up to a maximum weight after a single
+# precomputation of the non-dominated states (see sparse_states), each query is a binary search over the states
+# 1. items: list to keep track of instances of the Item class
+# 2. max_weight: integer to keep track on the largest capacity that can be queried
+# 3. weights: numpy array of the state weights in ascending order
+# 4. benefits: numpy array of the state benefits (ascending, the best benefit of each capacity is a step function)
+# 5. chains: list of the chosen item chains of the states
+class CapacityTable:
+    def __init__(self, items: list, max_weight: int):
+        states = sparse_states(items, max_weight)
+        self.items = items
+        self.max_weight = max_weight
+        self.weights = np.array(list(states.keys()), dtype=np.int64)
+        self.benefits = np.array([benefit for benefit, _ in states.values()], dtype=np.int64)
+        self.chains = [chain for _, chain in states.values()]
+
+    # Return the index of the heaviest state that fits in each of the capacities
+    def state_indices(self, capacities):
+        capacities = np.asarray(capacities, dtype=np.int64)
+        if np.any(capacities < 0) or np.any(capacities > self.max_weight):
+            raise Exception(f"Error! The capacities should be between 0 and {self.max_weight}.\n")
+        return np.searchsorted(self.weights, capacities, side="right") - 1
+
+    # Return the best benefit for a capacity
+    def best_benefit(self, capacity: int):
+        return int(self.benefits[self.state_indices(capacity)])
+
+    # Return the best benefits for a batch of capacities as a numpy array
+    def best_benefits(self, capacities: list):
+        return self.benefits[self.state_indices(capacities)]
+
+    # Return the solution for a capacity as an instance of the Node class (least weight among the best solutions)
+    def query(self, capacity: int):
+        return create_solution_node(self.items, chain_indices(self.chains[self.state_indices(capacity)]))
+
+    # Return the solutions for a batch of capacities as a list of instances of the Node class
+    def query_batch(self, capacities: list):
+        return [create_solution_node(self.items, chain_indices(self.chains[index]))
+                for index in self.state_indices(capacities)]
+
+
+# Function that returns the subsets of the items as a list of tuples (total weight, total benefit, chosen bitmask)
+# Subsets that are heavier than the maximum weight are left out, bit i of the bitmask is the item at index i + offset
+# 1. items: list to keep track of instances of the Item class
+# 2. max_weight: integer to keep track on the maximum weight of the knapsack
+# 3. offset: integer index of the first item in the list of all items
+def enumerate_subsets(items: list, max_weight: int, offset: int = 0):
+    subsets = [(0, 0, 0)]
+    for i, item in enumerate(items):
+        subsets += [(weight + item.weight, benefit + item.benefit, chosen | (1 << (i + offset)))
+                    for weight, benefit, chosen in subsets if weight + item.weight <= max_weight]
+    return subsets
+
+
+# Function that returns the Pareto front of the subsets sorted by weight (the lightest subset for each benefit level)
+# subsets: list of tuples (total weight, total benefit, chosen bitmask)
+def pareto_front(subsets: list):
+    subsets.sort(key=lambda subset: (subset[0], -subset[1]))
+    front = []
+    for subset in subsets:
+        if not front or subset[1] > front[-1][1]:
+            front.append(subset)
+    return front
+
+
+# Function that finds a solution using meet-in-the-middle in O(2 ** (n / 2) * log(2 ** (n / 2))) time
+# The subsets of both halves are sorted by weight and pruned to the Pareto front (a heavier subset needs a strictly
+# higher benefit), so a binary search finds the best complement for each subset of the first half
+# It does not depend on the capacity, so it can be used for huge weights with up to about 50 items
+# Choose solution with the least weight if there are several with the best benefit (same as uninformed_search)
+# 1. items: list to keep track of instances of the Item class
+# 2. max_weight: integer to keep track on the maximum weight of the knapsack
+def meet_in_the_middle(items: list, max_weight: int):
+    half = len(items) // 2
+    first_front = pareto_front(enumerate_subsets(items[:half], max_weight))
+    front = pareto_front(enumerate_subsets(items[half:], max_weight, half))
+    weights = [subset[0] for subset in front]
+
+    # For each subset of the first half, the last front subset that fits has the best benefit (and least weight)
+    solution = (0, 0, 0)
+    for weight, benefit, chosen in first_front:
+        complement = front[bisect_right(weights, max_weight - weight) - 1]
+        total_benefit, total_weight = benefit + complement[1], weight + complement[0]
+        if total_benefit > solution[0] or (total_benefit == solution[0] and total_weight < solution[1]):
+            solution = (total_benefit, total_weight, chosen | complement[2])
+    return create_solution_node(items, [i for i in range(len(items)) if solution[2] >> i & 1])
+
+
+# Function that returns the upper bound of the benefit in a subtree using the fractional relaxation
+# The remaining items (sorted by benefit/weight ratio) are added greedily and a fraction of the first that does not fit
+# 1. order: list of instances of the Item class sorted by benefit/weight ratio (highest first)
+# 2. depth: integer index of the first remaining item in the order
+# 3. benefit: integer to keep track of the summarized benefit of the chosen items
+# 4. weight: integer to keep track of the summarized weight of the chosen items
+# 5. max_weight: integer to keep track on the maximum weight of the knapsack
+def fractional_bound(order: list, depth: int, benefit: int, weight: int, max_weight: int):
+    bound = benefit
+    capacity = max_weight - weight
+    for item in order[depth:]:
+        if item.weight <= capacity:
+            capacity -= item.weight
+            bound += item.benefit
+        else:
+            return bound + item.benefit * capacity / item.weight
+    return bound
+
+
+# Function that finds a solution using depth-first (DFS) or best-first (BEST) branch and bound
+# The items are sorted by benefit/weight ratio and a subtree is pruned if its fractional bound can not beat the
+# solution, or can only tie it with a weight that is not lower (to keep the tie-break of uninformed_search)
+# 1. items: list to keep track of instances of the Item class
+# 2. max_weight: integer to keep track on the maximum weight of the knapsack
+# 3. algorithm: string to keep track on used algorithm (should contain either "DFS" or "BEST")
+# 4. statistics: dictionary to keep track of the number of expanded nodes (optional)
+def branch_and_bound(items: list, max_weight: int, algorithm: str, statistics: dict = None):
+    if algorithm.upper() != "DFS" and algorithm.upper() != "BEST":
+        raise Exception(f"Error! \"{algorithm}\" is not an implemented branch and bound algorithm.\n"
+                        f"Option 1: \"DFS\" to use depth-first branch and bound.\n"
+                        f"Option 2: \"BEST\" to use best-first branch and bound.\n")
+    if statistics is None:
+        statistics = dict()
+
+    # Sort the item indices by benefit/weight ratio, the chosen items of the nodes are indices in the item list
+    indices = sorted(range(len(items)),
+                     key=lambda i: items[i].benefit / items[i].weight if items[i].weight > 0 else float("inf"),
+                     reverse=True)
+    order = [items[i] for i in indices]
+
+    # Node to keep track of the solution with the best benefit value, start with empty an empty knapsack
+    node_solution = Node([], 0, 0, 0)
+
+    # Node stack (DFS) or priority queue ordered by the highest bound (BEST), the counter breaks ties in the queue
+    counter = 0
+    nodes = [(-fractional_bound(order, 0, 0, 0, max_weight), counter, node_solution)]
+
+    while len(nodes) > 0:
+        if algorithm.upper() == "BEST":
+            bound, _, node = heapq.heappop(nodes)
+        else:
+            bound, _, node = nodes.pop()
+        bound = -bound
+
+        # Prune the node if the bound can not beat the solution (benefits are integers, so the bound is floored)
+        if int(bound + 1e-9) < node_solution.total_benefit or \
+           (int(bound + 1e-9) == node_solution.total_benefit and node.total_weight >= node_solution.total_weight):
+            continue
+        statistics["nodes expanded"] = statistics.get("nodes expanded", 0) + 1
+
+        # Update solution node if the benefit of the current node is higher
+        # Choose solution with the least weight if they have equal benefit
+        if node.total_benefit > node_solution.total_benefit or \
+           (node.total_benefit == node_solution.total_benefit and node.total_weight < node_solution.total_weight):
+            node_solution = node
+
+        if node.depth < len(order):
+            item = order[node.depth]
+            children = []
+
+            # Scenario 1: take item (only if the total weight is lower or equal to the knapsack's max weight)
+            if node.total_weight + item.weight <= max_weight:
+                children.append(Node(
+                    chosen_items=node.chosen_items + [indices[node.depth]],
+                    total_benefit=node.total_benefit + item.benefit,
+                    total_weight=node.total_weight + item.weight,
+                    depth=node.depth + 1))
+
+            # Scenario 2: do not take item
+            children.append(Node(
+                chosen_items=node.chosen_items,
+                total_benefit=node.total_benefit,
+                total_weight=node.total_weight,
+                depth=node.depth + 1))
+
+            # Push the children (the stack pops the last child first, so the "take item" child is explored first)
+            for child in reversed(children):
+                child_bound = fractional_bound(order, child.depth, child.total_benefit, child.total_weight, max_weight)
+                counter += 1
+                if algorithm.upper() == "BEST":
+                    heapq.heappush(nodes, (-child_bound, counter, child))
+                else:
+                    nodes.append((-child_bound, counter, child))
+
+    return create_solution_node(items, node_solution.chosen_items)
+
+
+# Hashmap to keep track of the state of a worker process in the parallel search (set by initialize_worker)
+worker_state = dict()
+
+
+# Function that initializes a worker process in the parallel search
+# 1. items: list to keep track of instances of the Item class
+# 2. max_weight: integer to keep track on the maximum weight of the knapsack
+# 3. best_benefit: shared integer value to keep track of the best benefit found by any worker
+def initialize_worker(items: list, max_weight: int, best_benefit):
+    # The remaining items after each depth sorted by benefit/weight ratio (used for the fractional bound)
+    suffix_orders = [sorted(items[depth:],
+                            key=lambda item: item.benefit / item.weight if item.weight > 0 else float("inf"),
+                            reverse=True) for depth in range(len(items) + 1)]
+    worker_state["items"] = items
+    worker_state["max_weight"] = max_weight
+    worker_state["best_benefit"] = best_benefit
+    worker_state["suffix_orders"] = suffix_orders
+
+
+# Function that performs a depth-first search of a subtree in a worker process (same order as uninformed_search)
+# A node is pruned if its fractional bound is lower than the best benefit shared by all workers
+# Returns a tuple (total benefit, total weight, chosen bitmask, expanded nodes) of the first best node in the subtree
+# prefix: tuple (chosen bitmask, total benefit, total weight, depth) of the root of the subtree
+def search_subtree(prefix: tuple):
+    items = worker_state["items"]
+    max_weight = worker_state["max_weight"]
+    best_benefit = worker_state["best_benefit"]
+    suffix_orders = worker_state["suffix_orders"]
+
+    chosen, benefit, weight, _ = prefix
+    solution = (benefit, weight, chosen)
+    shared_benefit = best_benefit.value
+    expanded = 0
+    nodes = [prefix]
+    while len(nodes) > 0:
+        chosen, benefit, weight, depth = nodes.pop()
+
+        # Refresh the shared best benefit once in a while (reading it takes a lock)
+        if expanded % 1024 == 0:
+            shared_benefit = best_benefit.value
+        if int(fractional_bound(suffix_orders[depth], 0, benefit, weight, max_weight) + 1e-9) < shared_benefit:
+            continue
+        expanded += 1
+
+        # Update solution if the benefit is higher, or equal with a lower weight, and share the benefit
+        if benefit > solution[0] or (benefit == solution[0] and weight < solution[1]):
+            solution = (benefit, weight, chosen)
+            if benefit > shared_benefit:
+                with best_benefit.get_lock():
+                    if benefit > best_benefit.value:
+                        best_benefit.value = benefit
+                shared_benefit = best_benefit.value
+
+        # Push "take item" before "do not take item" so the stack pops them in the order of uninformed_search
+        if depth < len(items):
+            item = items[depth]
+            if weight + item.weight <= max_weight:
+                nodes.append((chosen | (1 << depth), benefit + item.benefit, weight + item.weight, depth + 1))
+            nodes.append((chosen, benefit, weight, depth + 1))
+
+    return solution + (expanded,)
+
+
+# Function that finds a solution by splitting the depth-first search tree at a depth across worker processes
+# Each of the (up to) 2 ** split_depth subtrees is searched by a worker, and the workers share the best benefit to
+# prune globally. The results are combined in depth-first order, so the solution is the same as uninformed_search
+# 1. items: list to keep track of instances of the Item class
+# 2. max_weight: integer to keep track on the maximum weight of the knapsack
+# 3. processes: integer that determine the number of worker processes
+# 4. split_depth: integer that determine the depth where the search tree is split
+# 5. statistics: dictionary to keep track of the number of expanded nodes (optional)
+def parallel_search(items: list, max_weight: int, processes: int, split_depth: int, statistics: dict = None):
+    if statistics is None:
+        statistics = dict()
+    split_depth = min(split_depth, len(items))
+
+    # Create the subtree roots in the order of the depth-first search ("do not take item" is explored first)
+    prefixes = [(0, 0, 0, 0)]
+    for depth in range(split_depth):
+        item = items[depth]
+        children = []
+        for chosen, benefit, weight, _ in prefixes:
+            children.append((chosen, benefit, weight, depth + 1))
+            if weight + item.weight <= max_weight:
+                children.append((chosen | (1 << depth), benefit + item.benefit, weight + item.weight, depth + 1))
+        prefixes = children
+
+    best_benefit = Value('q', 0)
+    with Pool(processes, initializer=initialize_worker, initargs=(items, max_weight, best_benefit)) as pool:
+        results = pool.map(search_subtree, prefixes, chunksize=1)
+
+    # Combine the results in depth-first order (only a strictly better result replaces the solution)
+    solution = (0, 0, 0)
+    for benefit, weight, chosen, expanded in results:
+        statistics["nodes expanded"] = statistics.get("nodes expanded", 0) + expanded
+        if benefit > solution[0] or (benefit == solution[0] and weight < solution[1]):
+            solution = (benefit, weight, chosen)
+    return create_solution_node(items, [i for i in range(len(items)) if solution[2] >> i & 1])
 
 
 # Entry point of the code
@@ -140,21 +555,135 @@ if __name__ == "__main__":
     # Measure memory usage and execution time for breadth-first search
     start_time = time.time()
     tracemalloc.start()
-    solution_node = uninformed_search(items, int(parameters["MAXIMUM WEIGHT"]), "BFS")
+    statistics = dict()
+    solution_node = uninformed_search(items, int(parameters["MAXIMUM WEIGHT"]), "BFS", statistics)
     _, peak_memory = tracemalloc.get_traced_memory()
     tracemalloc.stop()
     end_time = time.time()
     print(f"Breadth-first search execution time.......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
     print(f"Breadth-first search peak memory usage....: {(peak_memory / 10 ** 3):.5f} kilobytes")
+    print(f"Breadth-first search nodes expanded.......: {statistics['nodes expanded']}")
     print(solution_node)
 
     # Measure memory usage and execution time for depth-first search
     start_time = time.time()
     tracemalloc.start()
-    solution_node = uninformed_search(items, int(parameters["MAXIMUM WEIGHT"]), "DFS")
+    statistics = dict()
+    solution_node = uninformed_search(items, int(parameters["MAXIMUM WEIGHT"]), "DFS", statistics)
     _, peak_memory = tracemalloc.get_traced_memory()
     tracemalloc.stop()
     end_time = time.time()
     print(f"Depth-first search execution time.......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
     print(f"Depth-first search peak memory usage....: {(peak_memory / 10 ** 3):.5f} kilobytes")
+    print(f"Depth-first search nodes expanded.......: {statistics['nodes expanded']}")
+    print(solution_node)
+
+    # Measure memory usage and execution time for breadth-first and depth-first search with compact nodes
+    start_time = time.time()
+    tracemalloc.start()
+    solution_node = uninformed_search(items, int(parameters["MAXIMUM WEIGHT"]), "BFS", compact=True)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    end_time = time.time()
+    print(f"Compact breadth-first search execution time.......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    print(f"Compact breadth-first search peak memory usage....: {(peak_memory / 10 ** 3):.5f} kilobytes")
+    print(solution_node)
+
+    start_time = time.time()
+    tracemalloc.start()
+    solution_node = uninformed_search(items, int(parameters["MAXIMUM WEIGHT"]), "DFS", compact=True)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    end_time = time.time()
+    print(f"Compact depth-first search execution time.......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    print(f"Compact depth-first search peak memory usage....: {(peak_memory / 10 ** 3):.5f} kilobytes")
+    print(solution_node)
+
+    # Measure memory usage, execution time, and expanded nodes for depth-first and best-first branch and bound
+    start_time = time.time()
+    tracemalloc.start()
+    statistics = dict()
+    solution_node = branch_and_bound(items, int(parameters["MAXIMUM WEIGHT"]), "DFS", statistics)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    end_time = time.time()
+    print(f"Depth-first branch and bound execution time.......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    print(f"Depth-first branch and bound peak memory usage....: {(peak_memory / 10 ** 3):.5f} kilobytes")
+    print(f"Depth-first branch and bound nodes expanded.......: {statistics['nodes expanded']}")
+    print(solution_node)
+
+    start_time = time.time()
+    tracemalloc.start()
+    statistics = dict()
+    solution_node = branch_and_bound(items, int(parameters["MAXIMUM WEIGHT"]), "BEST", statistics)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    end_time = time.time()
+    print(f"Best-first branch and bound execution time.......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    print(f"Best-first branch and bound peak memory usage....: {(peak_memory / 10 ** 3):.5f} kilobytes")
+    print(f"Best-first branch and bound nodes expanded.......: {statistics['nodes expanded']}")
+    print(solution_node)
+
+    # Measure memory usage and execution time for dynamic programming (rolling array and sparse states)
+    start_time = time.time()
+    tracemalloc.start()
+    solution_node = dynamic_programming(items, int(parameters["MAXIMUM WEIGHT"]), "ARRAY")
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    end_time = time.time()
+    print(f"Dynamic programming execution time.......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    print(f"Dynamic programming peak memory usage....: {(peak_memory / 10 ** 3):.5f} kilobytes")
     print(solution_node)
+
+    start_time = time.time()
+    tracemalloc.start()
+    solution_node = dynamic_programming(items, int(parameters["MAXIMUM WEIGHT"]), "SPARSE")
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    end_time = time.time()
+    print(f"Sparse dynamic programming execution time.......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    print(f"Sparse dynamic programming peak memory usage....: {(peak_memory / 10 ** 3):.5f} kilobytes")
+    print(solution_node)
+
+    # Measure memory usage and execution time for meet-in-the-middle
+    start_time = time.time()
+    tracemalloc.start()
+    solution_node = meet_in_the_middle(items, int(parameters["MAXIMUM WEIGHT"]))
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    end_time = time.time()
+    print(f"Meet-in-the-middle execution time.......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    print(f"Meet-in-the-middle peak memory usage....: {(peak_memory / 10 ** 3):.5f} kilobytes")
+    print(solution_node)
+
+    # Measure the execution time of the parallel search for an increasing number of worker processes
+    split_depth = 6
+    execution_times = []
+    for processes in sorted(set([1, 2, 4, os.cpu_count()])):
+        start_time = time.time()
+        statistics = dict()
+        solution_node = parallel_search(items, int(parameters["MAXIMUM WEIGHT"]), processes, split_depth, statistics)
+        end_time = time.time()
+        execution_times.append(end_time - start_time)
+        print(f"Parallel search ({processes} processes) execution time.......: "
+              f"{((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+        print(f"Parallel search ({processes} processes) speedup..............: "
+              f"{(execution_times[0] / execution_times[-1]):.5f}")
+        print(f"Parallel search ({processes} processes) nodes expanded.......: {statistics['nodes expanded']}")
+    print(solution_node)
+
+    # Measure the execution time of 10000 capacity queries against a single precomputation
+    start_time = time.time()
+    capacity_table = CapacityTable(items, int(parameters["MAXIMUM WEIGHT"]))
+    end_time = time.time()
+    print(f"Capacity table precomputation time.......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    capacities = np.random.randint(0, int(parameters["MAXIMUM WEIGHT"]) + 1, size=10000)
+    start_time = time.time()
+    capacity_table.best_benefits(capacities)
+    end_time = time.time()
+    print(f"Capacity table benefit queries time......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    start_time = time.time()
+    capacity_table.query_batch(capacities)
+    end_time = time.time()
+    print(f"Capacity table solution queries time.....: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    print(capacity_table.query(int(parameters["MAXIMUM WEIGHT"])))
@@ -1,16 +1,27 @@
 import re  # Used for interpreting the input file
-from queue import PriorityQueue  # used for accessing a datastructure that adds elements according to a priority value
+import time  # Used for measuring the execution time
+import tracemalloc  # Used for measuring the memory usage
+import heapq  # used for accessing a datastructure that pops elements according to a priority value
+import pickle  # Used for saving the contraction hierarchy to disk
+import os  # Used for getting the number of processors
+import tempfile  # Used for the round trip of the contraction hierarchy when no file is configured
+from collections import OrderedDict  # Used for the least recently used cache of the route queries
+from multiprocessing import get_context  # Used for answering the route queries in parallel
+import random  # Used for the road distances of the synthetic grid
+from array import array  # Used for the compact adjacency arrays of the graph
 
 
 # City: class that represent cities (i.e. the vertices in the graph)
 # 1. name: string as a unique identifier for the city
 # 2. distance_to_goal: integer to keep track of the strait line distance to the goal (i.e. the city Valladolid)
 # 3. roads: list to keep track on the instances of the Road class
+# 4. coordinates: tuple (x, y) with the position of the city in the same unit as the roads (optional)
 class City:
-    def __init__(self, name: str, distance_to_goal: int, roads: list):
+    def __init__(self, name: str, distance_to_goal: int, roads: list, coordinates: tuple = None):
         self.name = name
         self.distance_to_goal = distance_to_goal
         self.roads = roads
+        self.coordinates = coordinates
 
     def __repr__(self):
         return f"[{self.name}, {self.distance_to_goal}, {self.roads}]"
@@ -24,6 +35,9 @@ class City:
     def add_distance_to_goal(self, distance_to_goal):
         self.distance_to_goal = distance_to_goal
 
+    def add_coordinates(self, coordinates):
+        self.coordinates = coordinates
+
 
 # Road: class that represent roads between cities (i.e. the edges in the graph)
 # 1. destination: string that represent the end destination of the road
@@ -59,6 +73,65 @@ class Node:
                f"Heuristic distance.: {self.heuristic_distance}"
 
 
+# Graph: class that represent the road network in compressed sparse row (CSR) format, the cities are integer ids
+# The roads of city v are at the positions offsets[v] to offsets[v + 1] of the targets and weights arrays
+# The City/Road API is available as a read-only view (graph[name] returns an instance of the City class)
+# 1. names: list of the city names (the index is the city id)
+# 2. ids: hashmap from the city name to the city id
+# 3. offsets: 64-bit integer array of length len(names) + 1 with the first road position of each city
+# 4. targets: 32-bit integer array with the destination id of each road
+# 5. weights: 32-bit integer array with the distance of each road
+# 6. distance_to_goal: integer array with the strait line distance of each city to the goal (i.e. Valladolid)
+# 7. coordinates: list of tuples (x, y) with the position of each city (None if unknown)
+class Graph:
+    def __init__(self, names: list, starts: array, ends: array, distances: array):
+        self.names = names
+        self.ids = {name: id for id, name in enumerate(names)}
+        self.distance_to_goal = array('i', [0]) * len(names)
+        self.coordinates = [None] * len(names)
+
+        # Count the roads of each city and sort the roads by start city (counting sort)
+        self.offsets = array('q', [0]) * (len(names) + 1)
+        for start in starts:
+            self.offsets[start + 1] += 1
+        for id in range(len(names)):
+            self.offsets[id + 1] += self.offsets[id]
+        positions = array('q', self.offsets[:-1])
+        self.targets = array('i', [0]) * len(starts)
+        self.weights = array('i', [0]) * len(starts)
+        for start, end, distance in zip(starts, ends, distances):
+            self.targets[positions[start]] = end
+            self.weights[positions[start]] = distance
+            positions[start] += 1
+
+    def __repr__(self):
+        return f"[{len(self.names)} cities, {len(self.targets)} roads]"
+
+    def __str__(self):
+        return f"[{len(self.names)} cities, {len(self.targets)} roads]"
+
+    # Return an instance of the City class for the city name (the roads are created on demand)
+    def __getitem__(self, name: str):
+        id = self.ids[name]
+        return City(name, self.distance_to_goal[id],
+                    [Road(self.names[self.targets[e]], self.weights[e])
+                     for e in range(self.offsets[id], self.offsets[id + 1])],
+                    self.coordinates[id])
+
+    def __contains__(self, name: str):
+        return name in self.ids
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
+
+    # Return the hashmap of instances of the City class that is used by informed_search (the city name is the key)
+    def to_cities(self):
+        return {name: self[name] for name in self.names}
+
+
 # Function that interpret the problem specification from "input.txt"
 # 1. parameters: dictionary to keep track of parameters (none of them is relevant in our case)
 # 2. cities: hashmap to keep track of instances of the City class (the city name is the key)
@@ -95,65 +168,846 @@ def specification(parameters: dict, cities: dict):
             city, distance = line.rstrip("\n").split(' ', 2)
             cities[city].add_distance_to_goal(int(distance))
 
+        # if line consists of one alphabetical word followed by two numbers it represents the coordinates of a city
+        elif re.search(r"^[a-zA-Z]+ -?\d+(\.\d+)? -?\d+(\.\d+)?$", line):
+            city, x, y = line.rstrip("\n").split(' ', 3)
+            cities[city].add_coordinates((float(x), float(y)))
+
 
-# Function that performs a greedy first search or A* search to find a path to Valladolid
+# Function that interpret the problem specification from "input.txt" into an instance of the Graph class
+# The city names are interned to integer ids while reading, so no instances of the City and Road classes are created
+# 1. parameters: dictionary to keep track of parameters (none of them is relevant in our case)
+# 2. filename: string with the name of the input file
+def load_graph(parameters: dict, filename: str = "input.txt"):
+    ids = dict()
+    starts, ends, distances = array('i'), array('i'), array('i')
+    distance_to_goal = dict()
+    coordinates = dict()
+    file = open(filename, 'r')
+    for line in file:
+        # if line contains a semicolon it represent a parameter
+        if re.search(":", line):
+            key, value = line.rstrip("\n").split(": ", 2)
+            parameters[key] = value
+
+        # if line consists of two alphabetical words followed by an integer it represents a road (in both directions)
+        elif re.search(r"^[a-zA-Z]+ [a-zA-Z]+ \d+$", line):
+            start_city, end_city, distance = line.rstrip("\n").split(' ', 3)
+            start_id = ids.setdefault(start_city, len(ids))
+            end_id = ids.setdefault(end_city, len(ids))
+            starts.extend((start_id, end_id))
+            ends.extend((end_id, start_id))
+            distances.extend((int(distance), int(distance)))
+
+        # if line consists of one alphabetical word followed by an integer it represents the distance to the goal
+        elif re.search(r"^[a-zA-Z]+ \d+$", line):
+            city, distance = line.rstrip("\n").split(' ', 2)
+            distance_to_goal[city] = int(distance)
+
+        # if line consists of one alphabetical word followed by two numbers it represents the coordinates of a city
+        elif re.search(r"^[a-zA-Z]+ -?\d+(\.\d+)? -?\d+(\.\d+)?$", line):
+            city, x, y = line.rstrip("\n").split(' ', 3)
+            coordinates[city] = (float(x), float(y))
+    file.close()
+
+    graph = Graph(list(ids), starts, ends, distances)
+    for city, distance in distance_to_goal.items():
+        graph.distance_to_goal[ids[city]] = distance
+    for city, position in coordinates.items():
+        graph.coordinates[ids[city]] = position
+    return graph
+
+
+# Function that returns an instance of the Graph class with a width x height grid of cities (used for benchmarks)
+# Each city has a road to its right and lower neighbour with a random distance between 10 and 100
+# 1. width: integer that determine the number of cities in a row
+# 2. height: integer that determine the number of cities in a column
+# 3. seed: integer for the random number generator
+def grid_graph(width: int, height: int, seed: int = 0):
+    generator = random.Random(seed)
+    starts, ends, distances = array('i'), array('i'), array('i')
+    for y in range(height):
+        for x in range(width):
+            neighbours = ([y * width + x + 1] if x + 1 < width else []) + \
+                         ([(y + 1) * width + x] if y + 1 < height else [])
+            for neighbour in neighbours:
+                distance = generator.randint(10, 100)
+                starts.extend((y * width + x, neighbour))
+                ends.extend((neighbour, y * width + x))
+                distances.extend((distance, distance))
+    graph = Graph([f"X{x}Y{y}" for y in range(height) for x in range(width)], starts, ends, distances)
+    graph.coordinates = [(x, y) for y in range(height) for x in range(width)]
+    return graph
+
+
+# Function that returns the path from the start city to a city by following the parent pointers
+# 1. parents: hashmap from a city name to the name of the previous city on the path (None for the start city)
+# 2. city_name: string to keep track of the last city on the path
+def reconstruct_path(parents: dict, city_name: str):
+    path = []
+    while city_name is not None:
+        path.append(city_name)
+        city_name = parents[city_name]
+    path.reverse()
+    return path
+
+
+# Function that computes the shortest distances from a city to all the cities using Dijkstra's algorithm
+# Returns a tuple of hashmaps (distances, parents) where the parents form the shortest path tree
+# 1. cities: hashmap to keep track of instances of the City class (the city name is the key)
+# 2. start_city_name: string to keep track of starting city in the search
+def dijkstra(cities: dict, start_city_name: str):
+    distances = {start_city_name: 0}
+    parents = {start_city_name: None}
+    closed = set()
+    queue = [(0, start_city_name)]
+    while len(queue) > 0:
+        distance, city_name = heapq.heappop(queue)
+        if city_name in closed:
+            continue
+        closed.add(city_name)
+        for road in cities[city_name].roads:
+            if road.destination not in distances or distance + road.distance < distances[road.destination]:
+                distances[road.destination] = distance + road.distance
+                parents[road.destination] = city_name
+                heapq.heappush(queue, (distance + road.distance, road.destination))
+    return distances, parents
+
+
+# Function that selects landmarks and precomputes the exact distances from them (used by landmark_heuristic)
+# The first landmark is the city farthest from an arbitrary city, the next is the city farthest from all landmarks
+# Returns a hashmap from the landmark name to a hashmap of the distances to all the cities
+# 1. cities: hashmap to keep track of instances of the City class (the city name is the key)
+# 2. count: integer that determine the number of landmarks
+def precompute_landmarks(cities: dict, count: int):
+    landmarks = dict()
+    distances, _ = dijkstra(cities, next(iter(cities)))
+    nearest_landmark = distances
+    for _ in range(min(count, len(cities))):
+        landmark = max(nearest_landmark, key=lambda city_name: (nearest_landmark[city_name], city_name))
+        if landmark in landmarks:
+            break
+        landmarks[landmark], _ = dijkstra(cities, landmark)
+        nearest_landmark = {city_name: min(distances[city_name] for distances in landmarks.values())
+                            for city_name in nearest_landmark}
+    return landmarks
+
+
+# Function that returns a heuristic from the straight line distance between the coordinates of the cities
+# The coordinates should be in the same unit as the roads, otherwise the heuristic is not admissible
+# 1. cities: hashmap to keep track of instances of the City class (the city name is the key)
+# 2. end_city_name: string to keep track of the destination in the search
+def coordinate_heuristic(cities: dict, end_city_name: str):
+    end_x, end_y = cities[end_city_name].coordinates
+    return lambda city_name: ((cities[city_name].coordinates[0] - end_x) ** 2 +
+                              (cities[city_name].coordinates[1] - end_y) ** 2) ** 0.5
+
+
+# Function that returns a heuristic from the landmark distances using the triangle inequality (ALT)
+# For every landmark L: distance(city, goal) >= |distance(L, goal) - distance(L, city)| (the roads are undirected)
+# 1. landmarks: hashmap from the landmark name to a hashmap of the distances to all the cities
+# 2. end_city_name: string to keep track of the destination in the search
+def landmark_heuristic(landmarks: dict, end_city_name: str):
+    def heuristic(city_name: str):
+        bound = 0
+        for distances in landmarks.values():
+            if city_name in distances and end_city_name in distances:
+                bound = max(bound, abs(distances[end_city_name] - distances[city_name]))
+        return bound
+    return heuristic
+
+
+# Function that performs a greedy first search or A* search to find a path to a destination
+# The priority queue holds tuples (priority, counter, city name), the counter breaks ties in insertion order
+# Each city is expanded at most once (closed set), and the path is reconstructed from the parent pointers
 # 1. cities: hashmap to keep track of instances of the City class (the city name is the key)
 # 2. start_city_name: string to keep track of starting city in the search
 # 3. algorithm: string to keep track on used algorithm (should contain either "A*" or "GFS")
-def informed_search(cities: dict, start_city_name: str, algorithm: str):
+# 4. statistics: dictionary to keep track of the number of expanded nodes (optional)
+# 5. end_city_name: string to keep track of the destination in the search
+# 6. heuristic: function from a city name to the estimated distance to the destination (see coordinate_heuristic and
+#    landmark_heuristic), by default the strait line distance of the input file when the destination is Valladolid
+#    and zero for other destinations (the input file only knows the distances to Valladolid)
+def informed_search(cities: dict, start_city_name: str, algorithm: str, statistics: dict = None,
+                    end_city_name: str = "Valladolid", heuristic=None):
     if algorithm.upper() != "A*" and algorithm.upper() != "GFS":
         raise Exception(f"Error! \"{algorithm}\" is not an implemented search algorithm.\n"
                         f"Option 1: \"A*\" to use A* search.\n"
                         f"Option 2: \"GFS\" to use greedy-first search.\n")
-
-    # Set the initial location and final destination (heuristic value will not matter in the first node)
-    # Unfortunately the destination is hardcoded, since we only know the strait line distance for that city
-    end_city_name = "Valladolid"
-    node = Node(cities[start_city_name], [start_city_name], 0, 0)
+    if statistics is None:
+        statistics = dict()
+    if heuristic is None and end_city_name == "Valladolid":
+        heuristic = lambda city_name: cities[city_name].distance_to_goal
+    elif heuristic is None:
+        heuristic = lambda city_name: 0
+
+    # Set the initial location (heuristic value will not matter in the first city)
+    traveled_distances = {start_city_name: 0}
+    parents = {start_city_name: None}
+    closed = set()
 
     # Initiate the priority queue (the lowest value will be popped first)
-    queue = PriorityQueue()
-    queue.put((node.heuristic_distance, node))
+    counter = 0
+    queue = [(0, counter, start_city_name)]
 
     # start search
-    while queue.not_empty:
-        node = queue.get()[1]
-        current_city = node.current_city
-        for road in current_city.roads:
-            next_city = cities[road.destination]
-            if next_city.name not in node.visited_cities:
-
-                # Determine the heuristic value
-                heuristic_distance = 0
-                if algorithm.upper() == "GFS":
-                    heuristic_distance = next_city.distance_to_goal
-                else:
-                    heuristic_distance = node.traveled_distance + road.distance + next_city.distance_to_goal
-
-                child_node = Node(
-                    current_city=next_city,
-                    visited_cities=node.visited_cities + [next_city.name],
-                    traveled_distance=node.traveled_distance + road.distance,
-                    heuristic_distance=heuristic_distance)
-
-                # Return the child node if a path to the destination was found, otherwise continue the search
-                if next_city.name == end_city_name:
-                    return child_node
-                else:
-                    queue.put((child_node.heuristic_distance, child_node))
+    while len(queue) > 0:
+        heuristic_distance, _, city_name = heapq.heappop(queue)
+
+        # Skip outdated queue entries of cities that were already expanded
+        if city_name in closed:
+            continue
+        closed.add(city_name)
+        statistics["nodes expanded"] = statistics.get("nodes expanded", 0) + 1
+
+        # Return a node with the path if the destination was reached, otherwise continue the search
+        if city_name == end_city_name:
+            return Node(
+                current_city=cities[city_name],
+                visited_cities=reconstruct_path(parents, city_name),
+                traveled_distance=traveled_distances[city_name],
+                heuristic_distance=heuristic_distance)
+
+        for road in cities[city_name].roads:
+            if road.destination in closed:
+                continue
+
+            # Only add the next city if the path to it is shorter than the best path found so far
+            traveled_distance = traveled_distances[city_name] + road.distance
+            if road.destination in traveled_distances and traveled_distances[road.destination] <= traveled_distance:
+                continue
+            traveled_distances[road.destination] = traveled_distance
+            parents[road.destination] = city_name
+
+            # Determine the heuristic value
+            if algorithm.upper() == "GFS":
+                heuristic_distance = heuristic(road.destination)
+            else:
+                heuristic_distance = traveled_distance + heuristic(road.destination)
+
+            counter += 1
+            heapq.heappush(queue, (heuristic_distance, counter, road.destination))
 
     # Return null if no path to the end city was found
     return None
 
 
+# Function that performs a bidirectional Dijkstra or A* search between two cities (the roads are undirected)
+# The forward search uses the potential p(v) = (heuristic(v) - reverse_heuristic(v)) / 2 and the backward search -p(v),
+# so both searches use consistent keys and the search stops when the sum of both queue tops reaches the best path
+# 1. cities: hashmap to keep track of instances of the City class (the city name is the key)
+# 2. start_city_name: string to keep track of starting city in the search
+# 3. algorithm: string to keep track on used algorithm (should contain either "A*" or "DIJKSTRA")
+# 4. statistics: dictionary to keep track of the number of expanded nodes (optional)
+# 5. end_city_name: string to keep track of the destination in the search
+# 6. heuristic: function from a city name to the estimated distance to the destination (same default as
+#    informed_search, i.e. zero unless the destination is Valladolid)
+# 7. reverse_heuristic: function from a city name to the estimated distance to the start city (zero by default)
+def bidirectional_search(cities: dict, start_city_name: str, algorithm: str, statistics: dict = None,
+                         end_city_name: str = "Valladolid", heuristic=None, reverse_heuristic=None):
+    if algorithm.upper() != "A*" and algorithm.upper() != "DIJKSTRA":
+        raise Exception(f"Error! \"{algorithm}\" is not an implemented bidirectional search algorithm.\n"
+                        f"Option 1: \"A*\" to use bidirectional A* search.\n"
+                        f"Option 2: \"DIJKSTRA\" to use bidirectional Dijkstra search.\n")
+    if statistics is None:
+        statistics = dict()
+    if algorithm.upper() == "DIJKSTRA":
+        potential = lambda city_name: 0
+    else:
+        if heuristic is None and end_city_name == "Valladolid":
+            heuristic = lambda city_name: cities[city_name].distance_to_goal
+        elif heuristic is None:
+            heuristic = lambda city_name: 0
+        if reverse_heuristic is None:
+            reverse_heuristic = lambda city_name: 0
+        potential = lambda city_name: (heuristic(city_name) - reverse_heuristic(city_name)) / 2
+
+    if start_city_name == end_city_name:
+        return Node(cities[end_city_name], [start_city_name], 0, 0)
+
+    # Index 0 is the forward search from the start city and index 1 the backward search from the end city
+    traveled_distances = ({start_city_name: 0}, {end_city_name: 0})
+    parents = ({start_city_name: None}, {end_city_name: None})
+    closed = (set(), set())
+    signs = (1, -1)
+    counter = 0
+    queues = ([(potential(start_city_name), counter, start_city_name)],
+              [(-potential(end_city_name), counter + 1, end_city_name)])
+    counter += 1
+
+    # Length and meeting city of the best path found so far
+    best_distance = float("inf")
+    meeting_city_name = None
+
+    while len(queues[0]) > 0 and len(queues[1]) > 0:
+        # Stop if no path through the unexpanded cities can be shorter than the best path
+        if queues[0][0][0] + queues[1][0][0] >= best_distance:
+            break
+
+        # Expand the search with the smaller queue
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        _, _, city_name = heapq.heappop(queues[side])
+        if city_name in closed[side]:
+            continue
+        closed[side].add(city_name)
+        statistics["nodes expanded"] = statistics.get("nodes expanded", 0) + 1
+
+        for road in cities[city_name].roads:
+            traveled_distance = traveled_distances[side][city_name] + road.distance
+            if road.destination in closed[side]:
+                continue
+            if road.destination in traveled_distances[side] and \
+               traveled_distances[side][road.destination] <= traveled_distance:
+                continue
+            traveled_distances[side][road.destination] = traveled_distance
+            parents[side][road.destination] = city_name
+            counter += 1
+            heapq.heappush(queues[side],
+                           (traveled_distance + signs[side] * potential(road.destination), counter, road.destination))
+
+            # Update the best path if the other search has reached the next city
+            if road.destination in traveled_distances[1 - side]:
+                distance = traveled_distance + traveled_distances[1 - side][road.destination]
+                if distance < best_distance:
+                    best_distance = distance
+                    meeting_city_name = road.destination
+
+    # Return null if no path to the end city was found
+    if meeting_city_name is None:
+        return None
+
+    # Join the path from the start city to the meeting city and the path from the meeting city to the end city
+    path = reconstruct_path(parents[0], meeting_city_name)
+    city_name = parents[1][meeting_city_name]
+    while city_name is not None:
+        path.append(city_name)
+        city_name = parents[1][city_name]
+    return Node(
+        current_city=cities[end_city_name],
+        visited_cities=path,
+        traveled_distance=best_distance,
+        heuristic_distance=best_distance)
+
+
+# Function that computes the shortest distances from a city id to all the city ids using Dijkstra's algorithm
+# Returns a tuple of hashmaps (distances, parents) from city id where the parents form the shortest path tree
+# 1. graph: instance of the Graph class
+# 2. start_id: integer id of the starting city in the search
+def csr_dijkstra(graph: Graph, start_id: int):
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = {start_id: 0}
+    parents = {start_id: -1}
+    closed = set()
+    queue = [(0, start_id)]
+    while len(queue) > 0:
+        distance, city = heapq.heappop(queue)
+        if city in closed:
+            continue
+        closed.add(city)
+        for e in range(offsets[city], offsets[city + 1]):
+            next_city = targets[e]
+            if next_city not in distances or distance + weights[e] < distances[next_city]:
+                distances[next_city] = distance + weights[e]
+                parents[next_city] = city
+                heapq.heappush(queue, (distance + weights[e], next_city))
+    return distances, parents
+
+
+# Function that returns a landmark heuristic (ALT) on city ids for an instance of the Graph class
+# 1. graph: instance of the Graph class
+# 2. landmarks: list of the landmark names (for example the keys of precompute_landmarks on a smaller graph)
+# 3. end_id: integer id of the destination in the search
+def csr_landmark_heuristic(graph: Graph, landmarks: list, end_id: int):
+    landmark_distances = [csr_dijkstra(graph, graph.ids[landmark])[0] for landmark in landmarks]
+    landmark_distances = [distances for distances in landmark_distances if end_id in distances]
+
+    def heuristic(city: int):
+        bound = 0
+        for distances in landmark_distances:
+            if city in distances:
+                bound = max(bound, abs(distances[end_id] - distances[city]))
+        return bound
+    return heuristic
+
+
+# ContractionHierarchy: class that represent a graph where the cities are contracted in order of importance
+# Only the upward roads (to a city with a higher rank) are kept, including the shortcuts that replace the paths
+# through the contracted cities, so a query is a bidirectional Dijkstra search that only goes upward
+# 1. names: list of the city names (the index is the city id)
+# 2. ids: hashmap from the city name to the city id
+# 3. rank: integer array with the contraction order of each city
+# 4. offsets: 64-bit integer array of length len(names) + 1 with the first upward road position of each city
+# 5. targets: 32-bit integer array with the destination id of each upward road
+# 6. weights: 64-bit integer array with the distance of each upward road
+# 7. middles: 32-bit integer array with the contracted city id of each shortcut (-1 for an original road)
+class ContractionHierarchy:
+    def __init__(self, graph: Graph, witness_limit: int = 50):
+        self.names = graph.names
+        self.ids = graph.ids
+
+        # Undirected adjacency during the contraction: roads[u][w] = (distance, middle city id)
+        roads = [dict() for _ in graph.names]
+        for u in range(len(graph.names)):
+            for e in range(graph.offsets[u], graph.offsets[u + 1]):
+                w = graph.targets[e]
+                if w != u and (w not in roads[u] or graph.weights[e] < roads[u][w][0]):
+                    roads[u][w] = (graph.weights[e], -1)
+                    roads[w][u] = (graph.weights[e], -1)
+
+        self.rank = array('i', [0]) * len(graph.names)
+        contracted = bytearray(len(graph.names))
+        contracted_neighbours = [0] * len(graph.names)
+        levels = [0] * len(graph.names)
+        upward_roads = [dict() for _ in graph.names]
+
+        # Function that returns the shortcuts needed to contract a city (the pairs of neighbours without a witness)
+        def shortcuts(v: int):
+            result = []
+            neighbours = [(u, distance) for u, (distance, _) in roads[v].items() if not contracted[u]]
+            for i, (u, u_distance) in enumerate(neighbours):
+                targets = {w: u_distance + w_distance for w, w_distance in neighbours[i + 1:]}
+                if not targets:
+                    continue
+
+                # Witness search: a limited Dijkstra search from u that does not pass through v
+                max_distance = max(targets.values())
+                distances = {u: 0}
+                queue = [(0, u)]
+                settled = 0
+                while len(queue) > 0 and settled < witness_limit:
+                    distance, x = heapq.heappop(queue)
+                    if distance > distances[x]:
+                        continue
+                    if distance > max_distance:
+                        break
+                    settled += 1
+                    for y, (road_distance, _) in roads[x].items():
+                        if y != v and not contracted[y] and distance + road_distance < distances.get(y, max_distance + 1):
+                            distances[y] = distance + road_distance
+                            heapq.heappush(queue, (distance + road_distance, y))
+                for w, distance in targets.items():
+                    if distances.get(w, max_distance + 1) > distance:
+                        result.append((u, w, distance))
+            return result
+
+        # Function that returns the importance of a city (edge difference, number of contracted neighbours and the
+        # level in the hierarchy, so the contracted cities are spread uniformly over the graph)
+        def importance(v: int):
+            degree = sum(1 for u in roads[v] if not contracted[u])
+            return 2 * (len(shortcuts(v)) - degree) + contracted_neighbours[v] + levels[v]
+
+        # Contract the cities in order of importance (lazy updates: recompute the importance when a city is popped)
+        queue = [(importance(v), v) for v in range(len(graph.names))]
+        heapq.heapify(queue)
+        order = 0
+        while len(queue) > 0:
+            _, v = heapq.heappop(queue)
+            current_importance = importance(v)
+            if len(queue) > 0 and current_importance > queue[0][0]:
+                heapq.heappush(queue, (current_importance, v))
+                continue
+            for u, w, distance in shortcuts(v):
+                if w not in roads[u] or distance < roads[u][w][0]:
+                    roads[u][w] = (distance, v)
+                    roads[w][u] = (distance, v)
+            contracted[v] = 1
+            self.rank[v] = order
+            order += 1
+            for u, road in roads[v].items():
+                if not contracted[u]:
+                    upward_roads[v][u] = road
+                    contracted_neighbours[u] += 1
+                    levels[u] = max(levels[u], levels[v] + 1)
+
+        # Store the upward roads in compressed sparse row format
+        self.offsets = array('q', [0])
+        self.targets, self.weights, self.middles = array('i'), array('q'), array('i')
+        for v in range(len(graph.names)):
+            for u, (distance, middle) in upward_roads[v].items():
+                self.targets.append(u)
+                self.weights.append(distance)
+                self.middles.append(middle)
+            self.offsets.append(len(self.targets))
+
+    def __repr__(self):
+        return f"[{len(self.names)} cities, {len(self.targets)} upward roads]"
+
+    def __str__(self):
+        return f"[{len(self.names)} cities, {len(self.targets)} upward roads]"
+
+    # Save the contraction hierarchy to a file
+    def save(self, filename: str):
+        with open(filename, 'wb') as file:
+            pickle.dump(self, file)
+
+    # Load a contraction hierarchy from a file
+    @staticmethod
+    def load(filename: str):
+        with open(filename, 'rb') as file:
+            return pickle.load(file)
+
+    # Return the upward road between two cities as a tuple (distance, middle city id)
+    def road(self, u: int, w: int):
+        if self.rank[u] > self.rank[w]:
+            u, w = w, u
+        for e in range(self.offsets[u], self.offsets[u + 1]):
+            if self.targets[e] == w:
+                return self.weights[e], self.middles[e]
+        raise Exception(f"Error! There is no road between \"{self.names[u]}\" and \"{self.names[w]}\".\n")
+
+    # Return the cities of a road without the first city (the shortcuts are replaced by the contracted cities)
+    def unpack(self, u: int, w: int):
+        _, middle = self.road(u, w)
+        if middle == -1:
+            return [w]
+        return self.unpack(u, middle) + self.unpack(middle, w)
+
+    # Return a tuple (distance, list of city names) of the shortest path between two cities (None if there is none)
+    # 1. start_city_name: string to keep track of starting city in the search
+    # 2. end_city_name: string to keep track of the destination in the search
+    # 3. statistics: dictionary to keep track of the number of expanded nodes (optional)
+    def query(self, start_city_name: str, end_city_name: str, statistics: dict = None):
+        if statistics is None:
+            statistics = dict()
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        start_id, end_id = self.ids[start_city_name], self.ids[end_city_name]
+
+        # Index 0 is the upward search from the start city and index 1 the upward search from the end city
+        distances = ({start_id: 0}, {end_id: 0})
+        parents = ({start_id: -1}, {end_id: -1})
+        queues = ([(0, start_id)], [(0, end_id)])
+        best_distance = float("inf") if start_id != end_id else 0
+        meeting_city = start_id if start_id == end_id else -1
+
+        # Each search stops when its queue top can not improve the best path
+        while (len(queues[0]) > 0 and queues[0][0][0] < best_distance) or \
+              (len(queues[1]) > 0 and queues[1][0][0] < best_distance):
+            side = 0 if len(queues[0]) > 0 and queues[0][0][0] < best_distance else 1
+            distance, city = heapq.heappop(queues[side])
+            if distance > distances[side][city]:
+                continue
+            statistics["nodes expanded"] = statistics.get("nodes expanded", 0) + 1
+            if city in distances[1 - side] and distance + distances[1 - side][city] < best_distance:
+                best_distance = distance + distances[1 - side][city]
+                meeting_city = city
+
+            # Stall on demand: do not continue from a city that is reached shorter through a higher city (the roads
+            # are undirected, so the roads from the higher cities are the upward roads of the city)
+            if any(targets[e] in distances[side] and distances[side][targets[e]] + weights[e] < distance
+                   for e in range(offsets[city], offsets[city + 1])):
+                continue
+            for e in range(offsets[city], offsets[city + 1]):
+                next_city = targets[e]
+                if distance + weights[e] < distances[side].get(next_city, float("inf")):
+                    distances[side][next_city] = distance + weights[e]
+                    parents[side][next_city] = city
+                    heapq.heappush(queues[side], (distance + weights[e], next_city))
+
+        if meeting_city == -1:
+            return None
+
+        # Join the upward paths at the meeting city and unpack the shortcuts
+        cities = []
+        city = meeting_city
+        while city != -1:
+            cities.append(city)
+            city = parents[0][city]
+        cities.reverse()
+        city = parents[1][meeting_city]
+        while city != -1:
+            cities.append(city)
+            city = parents[1][city]
+        path = [cities[0]]
+        for u, w in zip(cities, cities[1:]):
+            path += self.unpack(u, w)
+        return best_distance, [self.names[city] for city in path]
+
+
+# Function that performs a greedy first search or A* search on an instance of the Graph class (see informed_search)
+# The search only uses integer city ids and the adjacency arrays, the result is converted to the Node format
+# 1. graph: instance of the Graph class
+# 2. start_city_name: string to keep track of starting city in the search
+# 3. algorithm: string to keep track on used algorithm (should contain either "A*" or "GFS")
+# 4. statistics: dictionary to keep track of the number of expanded nodes (optional)
+# 5. end_city_name: string to keep track of the destination in the search
+# 6. heuristic: function from a city id to the estimated distance to the destination (see csr_landmark_heuristic),
+#    by default the strait line distance of the input file when the destination is Valladolid and zero otherwise
+def csr_search(graph: Graph, start_city_name: str, algorithm: str, statistics: dict = None,
+               end_city_name: str = "Valladolid", heuristic=None):
+    if algorithm.upper() != "A*" and algorithm.upper() != "GFS":
+        raise Exception(f"Error! \"{algorithm}\" is not an implemented search algorithm.\n"
+                        f"Option 1: \"A*\" to use A* search.\n"
+                        f"Option 2: \"GFS\" to use greedy-first search.\n")
+    if statistics is None:
+        statistics = dict()
+    if heuristic is None and end_city_name == "Valladolid":
+        heuristic = graph.distance_to_goal.__getitem__
+    elif heuristic is None:
+        heuristic = lambda city_id: 0
+    greedy = algorithm.upper() == "GFS"
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+    start_id, end_id = graph.ids[start_city_name], graph.ids[end_city_name]
+    traveled_distances = {start_id: 0}
+    parents = {start_id: -1}
+    closed = set()
+    counter = 0
+    queue = [(0, counter, start_id)]
+    expanded = 0
+
+    while len(queue) > 0:
+        heuristic_distance, _, city = heapq.heappop(queue)
+        if city in closed:
+            continue
+        closed.add(city)
+        expanded += 1
+
+        # Return a node with the path if the destination was reached, otherwise continue the search
+        if city == end_id:
+            statistics["nodes expanded"] = statistics.get("nodes expanded", 0) + expanded
+            path = []
+            while city != -1:
+                path.append(graph.names[city])
+                city = parents[city]
+            path.reverse()
+            return Node(
+                current_city=graph[end_city_name],
+                visited_cities=path,
+                traveled_distance=traveled_distances[end_id],
+                heuristic_distance=heuristic_distance)
+
+        traveled_distance = traveled_distances[city]
+        for e in range(offsets[city], offsets[city + 1]):
+            next_city = targets[e]
+            if next_city in closed:
+                continue
+            next_distance = traveled_distance + weights[e]
+            if next_city in traveled_distances and traveled_distances[next_city] <= next_distance:
+                continue
+            traveled_distances[next_city] = next_distance
+            parents[next_city] = city
+            counter += 1
+            if greedy:
+                heapq.heappush(queue, (heuristic(next_city), counter, next_city))
+            else:
+                heapq.heappush(queue, (next_distance + heuristic(next_city), counter, next_city))
+
+    # Return null if no path to the end city was found
+    statistics["nodes expanded"] = statistics.get("nodes expanded", 0) + expanded
+    return None
+
+
+# Hashmap to keep track of the state of a worker process in the route service (set by initialize_route_worker)
+route_worker_state = dict()
+
+
+# Function that initializes a worker process in the route service (the graph is inherited when the process is forked)
+def initialize_route_worker(graph: Graph):
+    route_worker_state["graph"] = graph
+
+
+# Function that answers the route queries from one start city in a worker process
+# A single query uses an early stopping Dijkstra search, several queries reuse one shortest path tree
+# Returns a list of tuples (distance, list of city names) or None if there is no path
+# 1. start_city_name: string to keep track of starting city in the search
+# 2. end_city_names: list of the destinations
+def route_queries(start_city_name: str, end_city_names: list):
+    graph = route_worker_state["graph"]
+    if len(end_city_names) == 1:
+        node = csr_search(graph, start_city_name, "A*", None, end_city_names[0], lambda city: 0)
+        return [(node.traveled_distance, node.visited_cities) if node is not None else None]
+
+    distances, parents = csr_dijkstra(graph, graph.ids[start_city_name])
+    routes = []
+    for end_city_name in end_city_names:
+        city = graph.ids[end_city_name]
+        if city not in distances:
+            routes.append(None)
+            continue
+        path = []
+        while city != -1:
+            path.append(graph.names[city])
+            city = parents[city]
+        path.reverse()
+        routes.append((distances[graph.ids[end_city_name]], path))
+    return routes
+
+
+# RouteService: class that answers batches of route queries on a graph that is loaded once
+# The queries are grouped by start city and sent to a process pool that shares the read-only graph, and the recent
+# results are kept in a least recently used cache
+# The workers are forked, so they inherit the graph instead of unpickling a copy each (as spawn and forkserver do)
+# 1. graph: instance of the Graph class
+# 2. cache_size: integer that determine the maximum number of cached routes
+# 3. cache: ordered hashmap from a tuple (start city name, end city name) to a tuple (distance, list of city names)
+# 4. statistics: dictionary to keep track of the number of queries, cache hits and reused shortest path trees
+# 5. pool: process pool of the workers
+class RouteService:
+    def __init__(self, graph: Graph, processes: int = os.cpu_count(), cache_size: int = 10000):
+        self.graph = graph
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.statistics = {"queries": 0, "cache hits": 0, "reused trees": 0}
+        self.pool = get_context("fork").Pool(processes, initializer=initialize_route_worker, initargs=(graph,))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *arguments):
+        self.close()
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+    # Return the routes of a batch of (start city name, end city name) queries in the same order
+    def query_batch(self, queries: list):
+        routes = [None] * len(queries)
+        misses = dict()
+        for i, query in enumerate(queries):
+            self.statistics["queries"] += 1
+            if query in self.cache:
+                self.statistics["cache hits"] += 1
+                self.cache.move_to_end(query)
+                routes[i] = self.cache[query]
+            else:
+                misses.setdefault(query[0], dict()).setdefault(query[1], []).append(i)
+
+        # Answer the missing routes per start city in the workers
+        start_city_names = list(misses)
+        results = self.pool.starmap(route_queries, [(start_city_name, list(misses[start_city_name]))
+                                                    for start_city_name in start_city_names])
+        for start_city_name, result in zip(start_city_names, results):
+            if len(misses[start_city_name]) > 1:
+                self.statistics["reused trees"] += 1
+            for (end_city_name, indices), route in zip(misses[start_city_name].items(), result):
+                for i in indices:
+                    routes[i] = route
+                self.cache[(start_city_name, end_city_name)] = route
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+        return routes
+
+
 # Entry point of the code
 if __name__ == "__main__":
+    benchmark = False  # Measure the contraction hierarchy and the route service on a synthetic grid
+    hierarchy_file = None  # Path to save the contraction hierarchy to (a temporary file is used when None)
     parameters = dict()
     cities = dict()
     specification(parameters, cities)
 
-    solution_node = informed_search(cities, "Malaga", "A*")
-    print(f"--------------- Search Using A* ---------------\n{solution_node}\n")
-
-    solution_node = informed_search(cities, "Malaga", "GFS")
-    print(f"--------------- Search Using GFS ---------------\n{solution_node}\n")
\ No newline at end of file
+    statistics = dict()
+    solution_node = informed_search(cities, "Malaga", "A*", statistics)
+    print(f"--------------- Search Using A* ---------------\n{solution_node}\n"
+          f"Nodes expanded.....: {statistics['nodes expanded']}\n")
+
+    statistics = dict()
+    solution_node = informed_search(cities, "Malaga", "GFS", statistics)
+    print(f"--------------- Search Using GFS ---------------\n{solution_node}\n"
+          f"Nodes expanded.....: {statistics['nodes expanded']}\n")
+
+    # Search between any pair of cities using the landmark heuristic (ALT)
+    landmarks = precompute_landmarks(cities, 4)
+    statistics = dict()
+    solution_node = informed_search(cities, "Coruna", "A*", statistics, "Barcelona",
+                                    landmark_heuristic(landmarks, "Barcelona"))
+    print(f"--------------- Search Using A* (landmarks {list(landmarks)}) ---------------\n{solution_node}\n"
+          f"Nodes expanded.....: {statistics['nodes expanded']}\n")
+
+    # Search on the compact graph representation (same result as informed_search)
+    graph = load_graph(dict())
+    statistics = dict()
+    solution_node = csr_search(graph, "Malaga", "A*", statistics)
+    print(f"--------------- Search Using A* (CSR graph {graph}) ---------------\n{solution_node}\n"
+          f"Nodes expanded.....: {statistics['nodes expanded']}\n")
+
+    # Measure memory usage and execution time of both representations on a synthetic grid
+    graph = grid_graph(300, 300)
+    graph_memory = sum(len(values) * values.itemsize for values in (graph.offsets, graph.targets, graph.weights))
+    tracemalloc.start()
+    grid_cities = graph.to_cities()
+    cities_memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Grid {graph} memory per road (City/Road)...: {(cities_memory / len(graph.targets)):.2f} bytes")
+    print(f"Grid {graph} memory per road (CSR).........: {(graph_memory / len(graph.targets)):.2f} bytes")
+
+    zero_heuristic = lambda city: 0
+    start_time = time.time()
+    solution_node = informed_search(grid_cities, "X0Y0", "A*", None, "X299Y299", zero_heuristic)
+    end_time = time.time()
+    print(f"Grid search execution time (City/Road)....: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    start_time = time.time()
+    csr_node = csr_search(graph, "X0Y0", "A*", None, "X299Y299", zero_heuristic)
+    end_time = time.time()
+    print(f"Grid search execution time (CSR)..........: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+    print(f"Grid search traveled distance.............: {solution_node.traveled_distance} "
+          f"{csr_node.traveled_distance}")
+
+    # Compare the expanded nodes of unidirectional A* with bidirectional Dijkstra and A* search
+    for name, search_cities, start_city_name, end_city_name in [("Spain", cities, "Coruna", "Barcelona"),
+                                                                ("Grid", grid_graph(100, 100).to_cities(),
+                                                                 "X0Y0", "X99Y99")]:
+        landmarks = precompute_landmarks(search_cities, 4)
+        heuristic = landmark_heuristic(landmarks, end_city_name)
+        reverse_heuristic = landmark_heuristic(landmarks, start_city_name)
+        for label, search in [("A*", lambda statistics: informed_search(
+                                  search_cities, start_city_name, "A*", statistics, end_city_name, heuristic)),
+                              ("Bidirectional Dijkstra", lambda statistics: bidirectional_search(
+                                  search_cities, start_city_name, "DIJKSTRA", statistics, end_city_name)),
+                              ("Bidirectional A*", lambda statistics: bidirectional_search(
+                                  search_cities, start_city_name, "A*", statistics, end_city_name,
+                                  heuristic, reverse_heuristic))]:
+            statistics = dict()
+            solution_node = search(statistics)
+            print(f"{name} {label} traveled distance / nodes expanded....: "
+                  f"{solution_node.traveled_distance} / {statistics['nodes expanded']}")
+
+    if benchmark:
+        # Measure the preprocessing time of a contraction hierarchy and compare its queries with informed_search
+        graph = grid_graph(80, 80)
+        start_time = time.time()
+        hierarchy = ContractionHierarchy(graph)
+        end_time = time.time()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = hierarchy_file if hierarchy_file is not None else os.path.join(directory, "hierarchy.pickle")
+            hierarchy.save(filename)
+            hierarchy = ContractionHierarchy.load(filename)
+        print(f"Contraction hierarchy {hierarchy} preprocessing time...: {(end_time - start_time):.5f} seconds")
+
+        grid_cities = graph.to_cities()
+        landmarks = precompute_landmarks(grid_cities, 4)
+        generator = random.Random(1)
+        queries = [(generator.choice(graph.names), generator.choice(graph.names)) for _ in range(100)]
+        start_time = time.time()
+        search_distances = [informed_search(grid_cities, start_city_name, "A*", None, end_city_name,
+                                            landmark_heuristic(landmarks, end_city_name)).traveled_distance
+                            for start_city_name, end_city_name in queries]
+        end_time = time.time()
+        print(f"A* search (landmarks) time per query..................: "
+              f"{((end_time - start_time) * 10 ** 3 / len(queries)):.5f} milliseconds")
+        start_time = time.time()
+        hierarchy_distances = [hierarchy.query(start_city_name, end_city_name)[0]
+                               for start_city_name, end_city_name in queries]
+        end_time = time.time()
+        print(f"Contraction hierarchy time per query..................: "
+              f"{((end_time - start_time) * 10 ** 3 / len(queries)):.5f} milliseconds")
+        print(f"Contraction hierarchy distances equal to A* search....: {search_distances == hierarchy_distances}")
+
+        # Measure the throughput of the route service on batches of queries that share start cities
+        generator = random.Random(2)
+        start_city_names = generator.sample(graph.names, 50)
+        end_city_names = generator.sample(graph.names, 400)
+        with RouteService(graph) as service:
+            for batch in range(3):
+                queries = [(generator.choice(start_city_names), generator.choice(end_city_names)) for _ in range(2000)]
+                start_time = time.time()
+                routes = service.query_batch(queries)
+                end_time = time.time()
+                print(f"Route service batch {batch + 1} queries per second........: "
+                      f"{(len(queries) / (end_time - start_time)):.2f}")
+                print(f"Route service batch {batch + 1} cache hit rate............: "
+                      f"{(service.statistics['cache hits'] / service.statistics['queries'] * 100):.2f}%")
+            print(f"Route service reused shortest path trees......: {service.statistics['reused trees']}")
+            print(f"Route service distances equal to the hierarchy: "
+                  f"{all(route[0] == hierarchy.query(*query)[0] for query, route in zip(queries[:100], routes))}")
@@ -1,8 +1,14 @@
 import re  # Used for interpreting the input file
 from copy import copy
-from math import sqrt  # Used for calculating distances between locations
-import matplotlib.pyplot as plt  # Used to graphically present the progress of the algorithm
+import numpy as np  # Used for the distance matrix and the population paths
 import random  # Used to generate random numbers
+import time  # Used for measuring the execution time
+from functools import lru_cache  # Used for reusing the preallocated crossover buffers
+import os  # Used for getting the number of processors
+from multiprocessing import Process, Queue  # Used for running the islands in parallel and migrating between them
+from collections import deque  # Used for the queue of locations in the local search
+from math import hypot  # Used for calculating distances between locations in the local search
+import json  # Used for streaming the progress as JSON Lines
 
 
 # Location: Class to keep track of locations to visit
@@ -22,14 +28,254 @@ class Location:
         return f"id: {self.id}, x: {self.x}, y: {self.y}"
 
 
+# Function that returns preallocated buffers for the crossovers of paths with a length (reused between crossovers)
+# Returns a tuple (location mask, path mask, location positions, path buffer) of numpy arrays
+# size: integer value that determine the length of the paths (the number of locations + 1)
+@lru_cache(maxsize=None)
+def crossover_buffers(size: int):
+    return np.zeros(size - 1, dtype=bool), np.zeros(size, dtype=bool), \
+        np.zeros(size - 1, dtype=np.int32), np.zeros(size, dtype=np.int32)
+
+
+# Function that performs an order crossover (OX) in O(n) and writes the result into the path
+# The section path[start:end] is taken from the partner and the remaining locations keep their order in the path
+# 1. path: integer array of the organism that is changed (begins and ends at location 0)
+# 2. partner_path: integer array of the partner
+# 3. start: integer index of the first location in the section
+# 4. end: integer index after the last location in the section
+def order_crossover(path: np.ndarray, partner_path: np.ndarray, start: int, end: int):
+    in_section, keep, _, buffer = crossover_buffers(len(path))
+    in_section[:] = False
+    in_section[partner_path[start:end]] = True
+    np.take(in_section, path, out=keep)
+    np.logical_not(keep, out=keep)
+    remaining = np.compress(keep, path, out=buffer[:len(path) - (end - start)])
+    path[:start] = remaining[:start]
+    path[end:] = remaining[start:]
+    path[start:end] = partner_path[start:end]
+
+
+# Function that performs a partially mapped crossover (PMX) in O(n) and writes the result into the path
+# The section path[start:end] is taken from the partner, a location outside the section that is also in the section
+# of the partner is replaced by following the mapping partner_path[i] -> path[i] until it is not in the section
+# 1. path: integer array of the organism that is changed (begins and ends at location 0)
+# 2. partner_path: integer array of the partner
+# 3. start: integer index of the first location in the section
+# 4. end: integer index after the last location in the section
+def partially_mapped_crossover(path: np.ndarray, partner_path: np.ndarray, start: int, end: int):
+    in_section, keep, positions, buffer = crossover_buffers(len(path))
+    in_section[:] = False
+    in_section[partner_path[start:end]] = True
+    positions[partner_path[start:end]] = np.arange(start, end, dtype=np.int32)
+    buffer[:] = path
+
+    # The conflicting locations follow the mapping one step at a time until they leave the section, the chains are
+    # disjoint, so the total work is O(n)
+    np.take(in_section, path, out=keep)
+    keep[start:end] = False
+    conflicts = np.flatnonzero(keep)
+    while len(conflicts) > 0:
+        path[conflicts] = buffer[positions[path[conflicts]]]
+        conflicts = conflicts[in_section[path[conflicts]]]
+    path[start:end] = partner_path[start:end]
+
+
+# Function that performs an edge recombination crossover (ERX) in O(n) and writes the result into the path
+# The path is built from location 0 by moving to the neighbour (in either parent) with the fewest remaining
+# neighbours, or to a random unvisited location if all neighbours are visited
+# 1. path: integer array of the organism that is changed (begins and ends at location 0)
+# 2. partner_path: integer array of the partner
+def edge_recombination_crossover(path: np.ndarray, partner_path: np.ndarray):
+    neighbours = [set() for _ in range(len(path) - 1)]
+    for parent in (path.tolist(), partner_path.tolist()):
+        for origin, destination in zip(parent, parent[1:]):
+            neighbours[origin].add(destination)
+            neighbours[destination].add(origin)
+
+    # Unvisited locations with their positions in the list (removed by swapping with the last element)
+    unvisited = list(range(1, len(path) - 1))
+    positions = list(range(-1, len(path) - 2))
+    child = [0]
+    location = 0
+    for _ in range(1, len(path) - 1):
+        for neighbour in neighbours[location]:
+            neighbours[neighbour].discard(location)
+        candidates = neighbours[location]
+        if candidates:
+            location = min(candidates, key=lambda candidate: len(neighbours[candidate]))
+        else:
+            location = unvisited[random.randint(0, len(unvisited) - 1)]
+        last = unvisited.pop()
+        if last != location:
+            unvisited[positions[location]] = last
+            positions[last] = positions[location]
+        neighbours[location].discard(0)
+        child.append(location)
+    path[:-1] = child
+
+
+# Function that returns the k nearest neighbours of each location using a grid of cells (no distance matrix)
+# The cells around a location are searched ring by ring until the k nearest neighbours are known to be found
+# 1. lookup: list of instances of the Location class to keep track of locations
+# 2. k: integer value that determine the number of neighbours of each location
+def nearest_neighbours(lookup: list, k: int):
+    k = min(k, len(lookup) - 1)
+    coordinates = np.array([(location.x, location.y) for location in lookup])
+    minimum = coordinates.min(axis=0)
+    extent = max(float((coordinates.max(axis=0) - minimum).max()), 1e-9)
+    cell_size = extent / max(1, int((len(lookup) / 2) ** 0.5))
+    cells = np.floor((coordinates - minimum) / cell_size).astype(np.int64)
+    grid = dict()
+    for i, (cx, cy) in enumerate(cells.tolist()):
+        grid.setdefault((cx, cy), []).append(i)
+
+    neighbours = []
+    for i, (cx, cy) in enumerate(cells.tolist()):
+        ring = 1
+        while True:
+            candidates = [j for x in range(cx - ring, cx + ring + 1) for y in range(cy - ring, cy + ring + 1)
+                          for j in grid.get((x, y), []) if j != i]
+            if len(candidates) >= k:
+                candidates = np.array(candidates)
+                distances = np.hypot(*(coordinates[candidates] - coordinates[i]).T)
+                nearest = np.argsort(distances, kind="stable")[:k]
+                # Every location within ring * cell_size is in the searched cells
+                if distances[nearest[-1]] <= ring * cell_size or len(candidates) == len(lookup) - 1:
+                    neighbours.append(candidates[nearest].tolist())
+                    break
+            ring += 1
+    return neighbours
+
+
+# Function that improves a path with 2-opt and Or-opt moves restricted to the nearest neighbours of each location
+# A location is only checked again (don't-look bit cleared) when one of its edges changed in an improving move
+# Returns the change in travel distance (the path is changed in place and still begins and ends at location 0)
+# 1. path: integer array to keep track on the order locations where visited (begins and ends at location 0)
+# 2. neighbours: list with the nearest neighbours of each location (see nearest_neighbours)
+# 3. lookup: list of instances of the Location class to keep track of locations
+def local_search(path: np.ndarray, neighbours: list, lookup: list):
+    tour = path[:-1].tolist()
+    n = len(tour)
+    if n < 5:
+        return 0.0
+    xs = [location.x for location in lookup]
+    ys = [location.y for location in lookup]
+    position = [0] * n
+    for i, location in enumerate(tour):
+        position[location] = i
+
+    def distance(a: int, b: int):
+        return hypot(xs[a] - xs[b], ys[a] - ys[b])
+
+    # Reverse the cyclic section of the tour from position i to position j (the shorter side is reversed)
+    def reverse(i: int, j: int):
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j, length = (j + 1) % n, (i - 1) % n, n - length
+        for _ in range(length // 2):
+            a, b = tour[i], tour[j]
+            tour[i], tour[j] = b, a
+            position[b], position[a] = i, j
+            i, j = (i + 1) % n, (j - 1) % n
+
+    # Replace the edges (a, b) and (c, d) with (a, c) and (b, d), where b follows a and d follows c in the same direction
+    def exchange(a: int, b: int, c: int, d: int):
+        if tour[(position[a] + 1) % n] == b:
+            reverse(position[b], position[c])
+        else:
+            reverse(position[c], position[b])
+
+    change = 0.0
+    queue = deque(tour)
+    queued = [True] * n
+    while len(queue) > 0:
+        a = queue.popleft()
+        queued[a] = False
+        changed = None
+
+        # 2-opt: replace the edges (a, b) and (c, d) with (a, c) and (b, d), in both directions of the tour
+        for direction in (1, -1):
+            b = tour[(position[a] + direction) % n]
+            ab = distance(a, b)
+            for c in neighbours[a]:
+                ac = distance(a, c)
+                if ac >= ab:
+                    break
+                d = tour[(position[c] + direction) % n]
+                if c == b or d == a:
+                    continue
+                delta = ac + distance(b, d) - ab - distance(c, d)
+                if delta < -1e-9:
+                    exchange(a, b, c, d)
+                    change += delta
+                    changed = (a, b, c, d)
+                    break
+            if changed:
+                break
+
+        # Or-opt: move the section of 1 to 3 locations that starts at a between u and v (its successor) next to a
+        # neighbour, with the orientation that adds the least distance
+        for length in (1, 2, 3):
+            if changed or n < length + 3:
+                break
+            section = [tour[(position[a] + i) % n] for i in range(length)]
+            first, last = section[0], section[-1]
+            before, after = tour[(position[first] - 1) % n], tour[(position[last] + 1) % n]
+            removal = distance(before, first) + distance(last, after) - distance(before, after)
+            for end, c in [(first, c) for c in neighbours[first]] + [(last, c) for c in neighbours[last]]:
+                # The neighbours are sorted by distance, a farther neighbour can not give a gain (same as in 2-opt)
+                if distance(end, c) >= removal:
+                    continue
+                for u, v in ((c, tour[(position[c] + 1) % n]), (tour[(position[c] - 1) % n], c)):
+                    if u in section or v in section or v == before:
+                        continue
+                    forward, backward = distance(u, first) + distance(last, v), distance(u, last) + distance(first, v)
+                    delta = min(forward, backward) - distance(u, v) - removal
+                    if delta >= -1e-9:
+                        continue
+
+                    # before S after ... u v  ->  before u ... after S' v  ->  before after ... u S' v
+                    exchange(before, first, u, v)
+                    exchange(before, u, after, last)
+                    if forward < backward:
+                        exchange(u, last, first, v)
+                    change += delta
+                    changed = (before, after, first, last, u, v)
+                    break
+                if changed:
+                    break
+
+        # Clear the don't-look bits of the locations with a changed edge
+        for location in changed or ():
+            if not queued[location]:
+                queued[location] = True
+                queue.append(location)
+
+    # Rotate the tour so it begins and ends at location 0 again
+    start = position[0]
+    path[:-1] = tour[start:] + tour[:start]
+    path[-1] = 0
+    return change
+
+
 # Organism: Class to keep track of the attributes in the organism
-# 1. path: list of integers to keep track on the order locations where visited (the values are indices in the lookup)
+# 1. path: integer array to keep track on the order locations where visited (the values are indices in the lookup),
+#    the paths of a population are the rows of one integer matrix (see create_population) and are changed in place
 # 2. lookup: list of instances of the Location class to keep track of locations
-# 3. fitness: float value to keep track of the summarized travel distance of the path
+# 3. distances: matrix with the distance between each pair of locations (see distance_matrix)
+# 4. paths: integer matrix of the population that contains the path as a row (a matrix of only the path by default)
+# 5. row: integer index of the path in the paths matrix
+# 6. fitness: float value to keep track of the summarized travel distance of the path
+# debug: boolean (shared by all organisms) that determine if incremental fitness updates are checked against evaluate
 class Organism:
-    def __init__(self, path: list, lookup: list):
+    debug = False
+
+    def __init__(self, path: np.ndarray, lookup: list, distances: np.ndarray, paths: np.ndarray = None, row: int = 0):
         self.path = path
+        self.paths = paths if paths is not None else path[np.newaxis]
+        self.row = row
         self.lookup = lookup
+        self.distances = distances
         self.fitness = 0
         self.evaluate()
 
@@ -38,27 +284,59 @@ class Organism:
         return self.lookup[self.path[index]]
 
     # Choose a random section of partners path and combine it with own path
-    def crossover(self, partner):
+    # operator: string to keep track on used crossover (should contain either "OX", "PMX", or "ERX")
+    def crossover(self, partner, operator: str = "OX"):
+        if operator.upper() == "ERX":
+            edge_recombination_crossover(self.path, partner.path)
+            return
         start = random.randint(1, len(self.path) - 2)
         end = random.randint(start, len(self.path) - 1)
-        section1 = partner.path[start:end]
-        section2 = [i for i in self.path if i not in section1]
-        self.path = section2[:start] + section1 + section2[start:]
+        if operator.upper() == "OX":
+            order_crossover(self.path, partner.path, start, end)
+        elif operator.upper() == "PMX":
+            partially_mapped_crossover(self.path, partner.path, start, end)
+        else:
+            raise Exception(f"Error! \"{operator}\" is not an implemented crossover operator.\n"
+                            f"Option 1: \"OX\" to use order crossover.\n"
+                            f"Option 2: \"PMX\" to use partially mapped crossover.\n"
+                            f"Option 3: \"ERX\" to use edge recombination crossover.\n")
 
     # Choose a random section of own path and reverse the order of the elements in that section
     def mutate(self):
         start = random.randint(1, len(self.path) - 2)
         end = random.randint(start, len(self.path) - 1)
-        self.path = self.path[:start] + self.path[end - 1:start - 1:-1] + self.path[end:]
+        self.reverse(start, end)
+
+    # Reverse the section path[start:end] (a 2-opt move) and update the fitness value in O(1)
+    # The distances are symmetric, so only the two edges at the boundaries of the section change
+    def reverse(self, start: int, end: int):
+        if end - start < 2:
+            return
+        a, b = self.path[start - 1], self.path[start]
+        c, d = self.path[end - 1], self.path[end]
+        self.fitness += float(self.distances[a, c] + self.distances[b, d] - self.distances[a, b] - self.distances[c, d])
+        self.path[start:end] = self.path[start:end][::-1].copy()
+        if Organism.debug:
+            self.check_fitness()
+
+    # Improve the path with the local search (2-opt and Or-opt) and update the fitness value incrementally
+    # neighbours: list with the nearest neighbours of each location (see nearest_neighbours)
+    def improve(self, neighbours: list):
+        self.fitness += local_search(self.path, neighbours, self.lookup)
+        if Organism.debug:
+            self.check_fitness()
+
+    # Compare the incrementally updated fitness value with a full evaluation (used in debug mode)
+    def check_fitness(self):
+        fitness = self.fitness
+        self.evaluate()
+        if abs(fitness - self.fitness) > 1e-6 * max(1.0, self.fitness):
+            raise Exception(f"Error! The incremental fitness {fitness} differs from the evaluated fitness "
+                            f"{self.fitness}.\n")
 
     # Calculate the fitness value (the travel distance of the path)
     def evaluate(self):
-        self.fitness = 0
-        for i in range(1, len(self.path)):
-            origin = self.get_location(i - 1)
-            destination = self.get_location(i)
-            distance = sqrt((destination.x - origin.x) ** 2 + (destination.y - origin.y) ** 2)
-            self.fitness += distance
+        self.fitness = float(self.distances[self.path[:-1], self.path[1:]].sum())
 
     def __repr__(self):
         return f"path: {self.path}, fitness: {self.fitness}\n"
@@ -67,21 +345,44 @@ class Organism:
         return f"path: {self.path}, fitness: {self.fitness}\n"
 
 
+# Function that returns a matrix with the distance between each pair of locations (computed once)
+# 1. lookup: list of instances of the Location class to keep track of locations
+def distance_matrix(lookup: list):
+    coordinates = np.array([(location.x, location.y) for location in lookup])
+    return np.sqrt(((coordinates[:, np.newaxis, :] - coordinates[np.newaxis, :, :]) ** 2).sum(axis=2))
+
+
 # Function that returns a population with randomized paths that visits all locations, but begins and ends at location 1
+# The paths are the rows of one integer matrix, so the fitness of the population can be computed at once
 # 1. lookup: list of instances of the Location class to keep track of locations
 # 2. population_size: integer value that determine the size of the population
-def create_population(lookup: list, population_size: int):
+# 3. distances: matrix with the distance between each pair of locations (see distance_matrix)
+def create_population(lookup: list, population_size: int, distances: np.ndarray):
     indices = list(range(1, len(lookup)))
+    paths = np.zeros((population_size, len(lookup) + 1), dtype=np.int32)
     population = []
     for i in range(population_size):
         path = copy(indices)
         random.shuffle(path)
-        path = [0] + path + [0]
-        population.append(Organism(path, lookup))
+        paths[i, 1:-1] = path
+        population.append(Organism(paths[i], lookup, distances, paths, i))
 
     return population
 
 
+# Function that calculate the fitness value of all organisms with one vectorized gather and sum of the distances
+# The gather runs directly on the paths matrix of the population (no copies of the paths), and the fitness values of
+# the organisms are picked by their row index
+# 1. population: list of instances of the Organism class (that share one paths matrix, see create_population)
+def evaluate_population(population: list):
+    if len(population) == 0:
+        return
+    paths = population[0].paths
+    fitness = population[0].distances[paths[:, :-1], paths[:, 1:]].sum(axis=1).tolist()
+    for organism in population:
+        organism.fitness = fitness[organism.row]
+
+
 # Function that sort the population according to the organisms' fitness value
 # 1. population: list of instances of the Organism class
 def sort_population(population: list):
@@ -92,21 +393,151 @@ def sort_population(population: list):
 # 1. population: list of instances of the Organism class
 # 2. elitism_percentage: float value to determine the percentage of the population that will be unaltered
 # 3. mutation_percentage: float value that determine the percentage of a mutation occurring
-def evolve_population(population: list, elitism_percentage: float, mutation_percentage: float):
+# 4. crossover_operator: string to keep track on used crossover (should contain either "OX", "PMX", or "ERX")
+# 5. neighbours: list with the nearest neighbours of each location to improve the offspring with the local search
+#    (see nearest_neighbours), the local search is skipped if it is None
+def evolve_population(population: list, elitism_percentage: float, mutation_percentage: float,
+                      crossover_operator: str = "OX", neighbours: list = None):
     n = int(len(population) * elitism_percentage)
     population_elitism = population[0:n]
     population_crossover = population[n:]
 
     for organism in population_crossover:
         partner = population_elitism[random.randint(0, n-1)]
-        organism.crossover(partner)
+        organism.crossover(partner, crossover_operator)
+    evaluate_population(population_crossover)
+
+    # The mutations update the fitness values incrementally
+    for organism in population_crossover:
         if random.random() <= mutation_percentage:
             organism.mutate()
-        organism.evaluate()
+
+    # Memetic stage: improve the offspring with the local search
+    if neighbours is not None:
+        for organism in population_crossover:
+            organism.improve(neighbours)
 
     population = population_elitism + population_crossover
 
 
+# ProgressLog: Class that streams the progress of the algorithm to a file (one line per generation)
+# The file is flushed after every line, so long runs can be monitored while they are running
+# 1. file: the opened file
+# 2. json_lines: boolean that is true if the file is written as JSON Lines (".jsonl" extension), otherwise as CSV
+class ProgressLog:
+    def __init__(self, filename: str):
+        self.file = open(filename, 'w')
+        self.json_lines = filename.endswith(".jsonl")
+        if not self.json_lines:
+            self.file.write("generation,fitness\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *arguments):
+        self.close()
+
+    def write(self, generation: int, fitness: float):
+        if self.json_lines:
+            self.file.write(json.dumps({"generation": generation, "fitness": fitness}) + "\n")
+        else:
+            self.file.write(f"{generation},{fitness}\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+# Function that returns the number of generations of each migration interval
+# The generations that remain after the last full interval are evolved as a shorter final interval
+# 1. generations: integer value that determine the number of generations
+# 2. migration_interval: integer value that determine the number of generations between the migrations
+def migration_intervals(generations: int, migration_interval: int):
+    intervals = [migration_interval] * (generations // migration_interval)
+    if generations % migration_interval:
+        intervals.append(generations % migration_interval)
+    return intervals
+
+
+# Function that evolves one island of the island model in a worker process
+# After every migration interval the paths of the elites are sent to the next island (as an integer matrix) and the
+# migrants from the previous island replace the worst organisms
+# 1. index: integer value that identifies the island (also used as random seed)
+# 2. lookup: list of instances of the Location class to keep track of locations
+# 3. parameters: dictionary with the genetic algorithm parameters (see island_model)
+# 4. inbox: queue with the migrants from the previous island
+# 5. outbox: queue with the migrants to the next island
+# 6. results: queue with a tuple (island index, best fitness of each generation, best path) for the initial population
+#    and after each interval
+def evolve_island(index: int, lookup: list, parameters: dict, inbox: Queue, outbox: Queue, results: Queue):
+    random.seed(parameters["seed"] + index)
+    np.random.seed(parameters["seed"] + index)
+    distances = distance_matrix(lookup)
+    neighbours = nearest_neighbours(lookup, parameters["neighbour count"]) if parameters["neighbour count"] else None
+    population = create_population(lookup, parameters["population size"], distances)
+    sort_population(population)
+    results.put((index, [population[0].fitness], population[0].path.copy()))
+
+    for interval in migration_intervals(parameters["generations"], parameters["migration interval"]):
+        progress = []
+        for _ in range(interval):
+            evolve_population(population, parameters["elitism percentage"], parameters["mutation percentage"],
+                              parameters["crossover operator"], neighbours)
+            sort_population(population)
+            progress.append(population[0].fitness)
+
+        # Ring migration: send the elites to the next island and replace the worst organisms with the migrants
+        outbox.put(np.stack([organism.path for organism in population[:parameters["migrants"]]]))
+        migrants = inbox.get()
+        replaced = population[len(population) - len(migrants):]
+        for organism, path in zip(replaced, migrants):
+            organism.path[:] = path
+        evaluate_population(replaced)
+        sort_population(population)
+
+        results.put((index, progress, population[0].path.copy()))
+
+
+# Function that runs a genetic algorithm with several populations (islands) in separate processes
+# Returns a tuple (best fitness of each generation over all islands, starting with the initial populations as
+# generation 0, best path, best fitness)
+# 1. lookup: list of instances of the Location class to keep track of locations
+# 2. islands: integer value that determine the number of islands (processes)
+# 3. parameters: dictionary with the genetic algorithm parameters ("population size", "elitism percentage",
+#    "mutation percentage", "crossover operator", "generations", "migration interval", "migrants", "seed" and
+#    "neighbour count" for the local search (0 to skip the local search))
+# 4. log: instance of the ProgressLog class to stream the progress after each migration interval (optional)
+def island_model(lookup: list, islands: int, parameters: dict, log: ProgressLog = None):
+    queues = [Queue() for _ in range(islands)]
+    results = Queue()
+    processes = [Process(target=evolve_island,
+                         args=(i, lookup, parameters, queues[i], queues[(i + 1) % islands], results))
+                 for i in range(islands)]
+    for process in processes:
+        process.start()
+
+    # Collect the results of all islands for the initial populations and after each migration interval
+    distances = distance_matrix(lookup)
+    progress = []
+    best_path, best_fitness = None, float("inf")
+    for interval in [1] + migration_intervals(parameters["generations"], parameters["migration interval"]):
+        interval_progress = [float("inf")] * interval
+        for _ in range(islands):
+            _, island_progress, path = results.get()
+            interval_progress = [min(a, b) for a, b in zip(interval_progress, island_progress)]
+            fitness = float(distances[path[:-1], path[1:]].sum())
+            if fitness < best_fitness:
+                best_path, best_fitness = path, fitness
+        for fitness in interval_progress:
+            progress.append(fitness)
+            if log is not None:
+                log.write(len(progress) - 1, fitness)
+
+    for process in processes:
+        process.join()
+    return progress, best_path, best_fitness
+
+
 # Function that interpret the problem specification from "input.txt"
 # 1. parameters: dictionary to keep track of parameters (none of them is relevant in our case)
 # 2. locations: list of instances of the Location class to keep track of the locations that should be visited
@@ -132,9 +563,10 @@ def specification(parameters: dict, locations: list):
             locations.append(Location(int(id), float(x), float(y)))
 
 
-# Function that display the progress graph
+# Function that display the progress graph (matplotlib is only imported when a graph is displayed)
 # 1. progress: list with float values that represent the best fitness (travel distance) of the corresponding generation
 def progress_graph(progress: list):
+    import matplotlib.pyplot as plt  # Used to graphically present the progress of the algorithm
     plt.rcParams.update({'font.size': 22})
     plt.plot(progress)
     plt.xlabel('Generation')
@@ -143,10 +575,11 @@ def progress_graph(progress: list):
     plt.show()
 
 
-# Function that display the path graph
+# Function that display the path graph (matplotlib is only imported when a graph is displayed)
 # 1. path: list of integers to keep track on the order locations where visited (the values are indices in the lookup)
 # 2. lookup: list of instances of the Location class to keep track of locations
 def path_graph(path: list, locations: list):
+    import matplotlib.pyplot as plt  # Used to graphically present the path
     plt.rcParams.update({'font.size': 22})
 
     fig, ax = plt.subplots()
@@ -185,31 +618,121 @@ if __name__ == "__main__":
 
     mutation_percentage = 0.15
     generations = 200
+    crossover_operator = "OX"
 
-    # Create an initial population with random values
-    population = create_population(locations, population_size)
-    sort_population(population)
+    # Measure the crossovers per second of each operator, the nearest neighbours and the local search on random
+    # paths after the run
+    benchmark = False
+
+    # Check the incremental fitness updates against a full evaluation (slow, only used for debugging)
+    Organism.debug = False
+
+    # Memetic algorithm parameters (improve the offspring with 2-opt and Or-opt on the nearest neighbours)
+    memetic = False
+    neighbour_count = 8
 
-    # Find solution using a genetic algorithm and keep track of
-    best = population[0]
-    progress = [best.fitness]
-    print(f"Generation: {0}, Fitness: {best.fitness}")
-    for generation in range(1, generations+1):
-        # Evolve the population (elitism, crossovers, and mutations)
-        evolve_population(population, elitism_percentage, mutation_percentage)
+    # Run without graphs (matplotlib is not imported), and stream the progress to a CSV or JSON Lines file
+    # (the progress is only written to a file if progress_file is set, and only kept in memory for the graphs)
+    headless = False
+    progress_file = None
 
-        # Sort the population according to the organisms' fitness values
+    # Island model parameters (the populations evolve in separate processes and exchange elites in a ring)
+    island_mode = False
+    islands = os.cpu_count()
+    migration_interval = 10
+    migrants = 2
+
+    # Create an initial population with random values
+    distances = distance_matrix(locations)
+    neighbours = nearest_neighbours(locations, neighbour_count) if memetic else None
+    log = ProgressLog(progress_file) if progress_file is not None else None
+    start_time = time.time()
+    if island_mode:
+        # Find solution using several populations and keep track of the best of all islands
+        progress, best_path, _ = island_model(locations, islands, {
+            "population size": population_size,
+            "elitism percentage": elitism_percentage,
+            "mutation percentage": mutation_percentage,
+            "crossover operator": crossover_operator,
+            "generations": generations,
+            "migration interval": migration_interval,
+            "migrants": migrants,
+            "seed": random.randint(0, 2 ** 16),
+            "neighbour count": neighbour_count if memetic else 0}, log)
+        for generation in range(0, len(progress), 10):
+            print(f"Generation: {generation}, Fitness: {progress[generation]}")
+        best = Organism(best_path, locations, distances)
+    else:
+        population = create_population(locations, population_size, distances)
         sort_population(population)
 
-        # Save the best in the generation
+        # Find solution using a genetic algorithm and keep track of
         best = population[0]
-        progress.append(best.fitness)
-
-        # Print the generational progress
-        if generation % 10 == 0:
-            print(f"Generation: {generation}, Fitness: {best.fitness}")
+        progress = None if headless else [best.fitness]
+        if log is not None:
+            log.write(0, best.fitness)
+        print(f"Generation: {0}, Fitness: {best.fitness}")
+        for generation in range(1, generations+1):
+            # Evolve the population (elitism, crossovers, and mutations)
+            evolve_population(population, elitism_percentage, mutation_percentage, crossover_operator, neighbours)
+
+            # Sort the population according to the organisms' fitness values
+            sort_population(population)
+
+            # Save the best in the generation
+            best = population[0]
+            if progress is not None:
+                progress.append(best.fitness)
+            if log is not None:
+                log.write(generation, best.fitness)
+
+            # Print the generational progress
+            if generation % 10 == 0:
+                print(f"Generation: {generation}, Fitness: {best.fitness}")
+    end_time = time.time()
+    if log is not None:
+        log.close()
     print(best)
+    print(f"Generations per second: {(generations / (end_time - start_time)):.2f}")
+
+    if benchmark:
+        # Measure the number of crossovers per second for each operator on random paths
+        for size in [52, 1000, 10000]:
+            paths = np.zeros((3, size + 1), dtype=np.int32)
+            paths[0, 1:-1] = np.random.permutation(np.arange(1, size))
+            paths[1, 1:-1] = np.random.permutation(np.arange(1, size))
+            for operator in ["OX", "PMX", "ERX"]:
+                crossovers = 0
+                start_time = time.time()
+                while time.time() - start_time < 0.5:
+                    start = random.randint(1, size - 1)
+                    end = random.randint(start, size)
+                    paths[2] = paths[0]
+                    if operator == "OX":
+                        order_crossover(paths[2], paths[1], start, end)
+                    elif operator == "PMX":
+                        partially_mapped_crossover(paths[2], paths[1], start, end)
+                    else:
+                        edge_recombination_crossover(paths[2], paths[1])
+                    crossovers += 1
+                print(f"Crossovers per second ({operator}, {size} locations): "
+                      f"{(crossovers / (time.time() - start_time)):.2f}")
+
+        # Measure the time of the nearest neighbours and the local search on a random path with 10000 random locations
+        random_locations = [Location(i + 1, random.random() * 10000, random.random() * 10000) for i in range(10000)]
+        start_time = time.time()
+        random_neighbours = nearest_neighbours(random_locations, neighbour_count)
+        end_time = time.time()
+        print(f"Nearest neighbours time (10000 locations): {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+        random_path = np.zeros(len(random_locations) + 1, dtype=np.int32)
+        random_path[1:-1] = np.random.permutation(np.arange(1, len(random_locations)))
+        start_time = time.time()
+        change = local_search(random_path, random_neighbours, random_locations)
+        end_time = time.time()
+        print(f"Local search time (10000 locations)......: {((end_time - start_time) * 10 ** 3):.5f} milliseconds")
+        print(f"Local search change (10000 locations)....: {change:.2f}")
 
     # Display the result
-    progress_graph(progress)
-    path_graph(best.path, locations)
+    if not headless:
+        progress_graph(progress)
+        path_graph(best.path, locations)
@@ -2,7 +2,7 @@ import re  # Used for interpreting the input file
 from math import sqrt
 import numpy as np
 import random  # Used to generate random numbers and performing weighted choices
-import matplotlib.pyplot as plt
+import json  # Used for streaming the progress as JSON Lines
 
 
 # Location: Class to keep track of locations to visit
@@ -149,8 +149,37 @@ def specification(parameters: dict, locations: list):
             locations.append(Location(int(id), float(x), float(y)))
 
 
-# Display the progress graph
+# ProgressLog: Class that streams the progress of the algorithm to a file (one line per iteration)
+# The file is flushed after every line, so long runs can be monitored while they are running
+# 1. file: the opened file
+# 2. json_lines: boolean that is true if the file is written as JSON Lines (".jsonl" extension), otherwise as CSV
+class ProgressLog:
+    def __init__(self, filename: str):
+        self.file = open(filename, 'w')
+        self.json_lines = filename.endswith(".jsonl")
+        if not self.json_lines:
+            self.file.write("iteration,travel_distance\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *arguments):
+        self.close()
+
+    def write(self, iteration: int, travel_distance: float):
+        if self.json_lines:
+            self.file.write(json.dumps({"iteration": iteration, "travel_distance": travel_distance}) + "\n")
+        else:
+            self.file.write(f"{iteration},{travel_distance}\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+# Display the progress graph (matplotlib is only imported when a graph is displayed)
 def progress_graph(progress: list):
+    import matplotlib.pyplot as plt
     plt.rcParams.update({'font.size': 22})
     plt.plot(progress)
     plt.xlabel('Generation')
@@ -159,8 +188,9 @@ def progress_graph(progress: list):
     plt.show()
 
 
-# Display the path graph
+# Display the path graph (matplotlib is only imported when a graph is displayed)
 def path_graph(path: list, locations: list):
+    import matplotlib.pyplot as plt
     plt.rcParams.update({'font.size': 22})
     fig, ax = plt.subplots()
     plt.xlabel("X-axis")
@@ -199,11 +229,17 @@ if __name__ == "__main__":
     population_size = 250
     iterations = 200
 
+    # Run without graphs (matplotlib is not imported), and stream the progress to a CSV or JSON Lines file
+    # (the progress is only written to a file if progress_file is set, and only kept in memory for the graphs)
+    headless = False
+    progress_file = None
+
     # Create the lookup for the roads and their initial pheromones values
     roads = Roads(locations, 1)
 
-    progress = []
+    progress = None if headless else []
     best = None
+    log = ProgressLog(progress_file) if progress_file is not None else None
     for iteration in range(1, iterations + 1):
         # Create a new population and let them travel to all locations and then back to the starting location
         population = create_population(roads, population_size)
@@ -213,7 +249,10 @@ if __name__ == "__main__":
 
         # Sort the organisms in the population in based on the travel distance
         sort_population(population)
-        progress.append(population[0].travel_distance)
+        if progress is not None:
+            progress.append(population[0].travel_distance)
+        if log is not None:
+            log.write(iteration, float(population[0].travel_distance))
         if best is None or population[0].travel_distance < best.travel_distance:
             best = population[0]
         print(f"Iteration: {iteration}, Travel Distance: {population[0].travel_distance}")
@@ -221,6 +260,10 @@ if __name__ == "__main__":
         # Emit pheromones
         pheromones_update(population, roads, pheromone_persistence)
 
+    if log is not None:
+        log.close()
+
     # Display the result
-    progress_graph(progress)
-    path_graph(best.path, locations)
+    if not headless:
+        progress_graph(progress)
+        path_graph(best.path, locations)